@@ -102,6 +102,15 @@ def getSVG(shape, opts=None, view_vector=(-0, 0, 20.0)):
     """
         Export a shape to SVG
     """
+    s = io.StringIO()
+    writeSVG(shape, s, opts=opts, view_vector=view_vector)
+    return s.getvalue()
+
+
+def writeSVG(shape, f, opts=None, view_vector=(-0, 0, 20.0)):
+    """
+        Stream a shape as SVG into the file object f
+    """
 
     d = {"width": 800, "height": 800, "marginLeft": 20, "marginTop": 20}
 
@@ -142,31 +151,26 @@ def getSVG(shape, opts=None, view_vector=(-0, 0, 20.0)):
         (0 - bb.YMax) - marginTop / unitScale,
     )
 
-    # compute paths ( again -- had to strip out freecad crap )
-    hiddenContent = ""
-    for p in hiddenPaths:
-        hiddenContent += PATHTEMPLATE % p
-    visibleContent = ""
-    for p in visiblePaths:
-        visibleContent += PATHTEMPLATE % p
-
-    svg = SVG_TEMPLATE % (
-        {
-            "unitScale": str(unitScale),
-            "strokeWidth": "0.1",
-            "hiddenContent": visibleContent,
-            "xTranslate": str(xTranslate),
-            "yTranslate": str(yTranslate),
-            "width": str(width),
-            "height": str(height),
-            "textboxY": str(height - 30),
-            "uom": str(uom),
-        }
+    # write paths straight out ( again -- had to strip out freecad crap )
+    head, tail = SVG_TEMPLATE.split("%(hiddenContent)s")
+    f.write(
+        head
+        % (
+            {
+                "unitScale": str(unitScale),
+                "strokeWidth": "0.1",
+                "xTranslate": str(xTranslate),
+                "yTranslate": str(yTranslate),
+                "width": str(width),
+                "height": str(height),
+                "textboxY": str(height - 30),
+                "uom": str(uom),
+            }
+        )
     )
-    # svg = SVG_TEMPLATE % (
-    #    {"content": projectedContent}
-    # )
-    return svg
+    for p in visiblePaths:
+        f.write(PATHTEMPLATE % p)
+    f.write(tail)
 
 
 def exportSVG(shape, fileName, view_vector=(0, 0, 20)):
@@ -175,10 +179,8 @@ def exportSVG(shape, fileName, view_vector=(0, 0, 20)):
         TODO: should use file-like objects, not a fileName, and/or be able to return a string instead
         export a view of a part to svg
     """
-    svg = getSVG(shape.val().wrapped, opts=None, view_vector=view_vector)
-    f = open(fileName, "w")
-    f.write(svg)
-    f.close()
+    with open(fileName, "w") as f:
+        writeSVG(shape.val().wrapped, f, opts=None, view_vector=view_vector)
 
 
 SVG_TEMPLATE = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
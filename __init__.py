@@ -39,3 +39,74 @@ __all__ = [
     "threaded",
     "partref",
 ]
+
+# nothing above is imported until it is used , the submodules pull in
+# cadquery and the other cqparts packages. Classes resolve through the
+# generated _registry ( python -m cqparts_bucket.registry )
+
+import importlib
+from collections.abc import Mapping
+
+from ._registry import CLASSES, REGISTERED
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module("." + name, __name__)
+    if name in CLASSES:
+        module = importlib.import_module("." + CLASSES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(CLASSES))
+
+
+def classname(module, name):
+    return "%s.%s.%s" % (__name__, module, name)
+
+
+def find_class(classname):
+    " the class for a full dotted name , imports its module only "
+    module, name = classname.rsplit(".", 1)
+    return getattr(importlib.import_module(module), name)
+
+
+def search_index(key="export"):
+    """
+    value -> [ classname ] of the registered parts for one criteria key ,
+    or category -> value -> [ classname ] with key=None , like
+    cqparts.search.index but without importing anything
+    """
+    index = {}
+    for module, name, criteria in REGISTERED:
+        for k, v in criteria.items():
+            index.setdefault(k, {}).setdefault(v, []).append(classname(module, name))
+    if key is None:
+        return index
+    return index.get(key, {})
+
+
+class Classes(Mapping):
+    " classname -> class for the registered parts , loaded when looked up "
+
+    def __init__(self):
+        self.names = sorted(set(classname(m, n) for m, n, c in REGISTERED))
+        self.loaded = {}
+
+    def __getitem__(self, key):
+        if key not in self.loaded:
+            if key not in self.names:
+                raise KeyError(key)
+            self.loaded[key] = find_class(key)
+        return self.loaded[key]
+
+    def __contains__(self, key):
+        return key in self.names
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
@@ -0,0 +1,292 @@
+# generated by python -m cqparts_bucket.registry , do not edit
+
+CLASSES = {'AA': 'battery',
+ 'AAA': 'battery',
+ 'AeroMotor': 'rocket_drone',
+ 'Arduino': 'controller',
+ 'ArduinoBoard': 'mounted_board',
+ 'Arrange': 'multi',
+ 'Atx': 'atx',
+ 'Axis': 'cnc',
+ 'Axle': 'car',
+ 'Battpack': 'battery',
+ 'BeagleBoard': 'mounted_board',
+ 'BeagleBoneBlack': 'controller',
+ 'BeardBoss': 'beard_boss',
+ 'Bearing': 'cnc',
+ 'BearingMount': 'roller',
+ 'Belt': 'belt',
+ 'BeltAssembly': 'driver',
+ 'BeltAxis': 'cnc',
+ 'BeltDrive': 'driver',
+ 'Blade': 'rocket_drone',
+ 'Bogie': 'train',
+ 'BoolList': 'box',
+ 'Boss': 'boss',
+ 'Bottom': 'box',
+ 'Box': 'bork',
+ 'BoxedBoard': 'boxed_board',
+ 'Boxen': 'box',
+ 'Boxes': 'case_arr',
+ 'Bucket': 'bucket',
+ 'BuiltBox': 'flux_capacitor',
+ 'BuiltWheel': 'wheel',
+ 'Button': 'button',
+ 'C': 'battery',
+ 'CNC_show': 'cnc',
+ 'Car': 'car',
+ 'Carriage': 'cnc',
+ 'Case': 'case',
+ 'CenterDisc': 'wheel',
+ 'Chassis': 'car',
+ 'Circle': 'servo_horns',
+ 'CirclePanTilt': 'circle_pan_tilt',
+ 'ClothesPeg': 'peg',
+ 'CoffeTable': 'ct1',
+ 'CompleteFlux': 'flux_capacitor',
+ 'ComputerScrew': 'mounted_board',
+ 'ControlPanel': 'project_case',
+ 'ControlRow': 'control_panel',
+ 'Coupling': 'coupling',
+ 'Cowl': 'rocket_drone',
+ 'CutQueue': 'alterations',
+ 'Cyl': 'bork',
+ 'CylBattery': 'battery',
+ 'Cylindrical': 'dc',
+ 'D': 'battery',
+ 'DCMotor': 'dc',
+ 'Demo': 'train',
+ 'Diorama': 'train',
+ 'Drive': 'driver',
+ 'DriveEnd': 'cnc',
+ 'Electrode': 'flux_capacitor',
+ 'ElectrodeAssem': 'flux_capacitor',
+ 'Electronics': 'electronics',
+ 'Emmitter': 'sonar',
+ 'EndBlock': 'cnc',
+ 'ExportTypes': 'SVGexport',
+ 'Extractor': 'extract',
+ 'FingerHole': 'pencil_case',
+ 'FlatBatt': 'battery',
+ 'FlipBox': 'flip_box',
+ 'FlushFastener': 'robot_base_mount',
+ 'FluxCap': 'flux_capacitor',
+ 'FourArm': 'servo_horns',
+ 'FullLoco': 'train',
+ 'FullTank': 'train',
+ 'FullWagon': 'train',
+ 'GLB': 'gltf',
+ 'Gallery': 'multi',
+ 'GearStack': 'gear',
+ 'GlasgowRevC': 'controller',
+ 'Handle': 'handle',
+ 'HingeL': 'flip_box',
+ 'HingeR': 'flip_box',
+ 'IdleEnd': 'cnc',
+ 'Idler': 'idler',
+ 'Interner': 'cache',
+ 'Involute': 'involute',
+ 'Item': 'extract',
+ 'LED': 'led',
+ 'Lasercut': 'manufacture',
+ 'Lcd': 'lcd',
+ 'Left': 'box',
+ 'Li18650': 'battery',
+ 'Lid': 'flip_box',
+ 'LinearBearing': 'linear_bearing',
+ 'Loco': 'train',
+ 'LongStepper': 'motor_mount',
+ 'MercanumWheel': 'mercanum',
+ 'Mill': 'mill',
+ 'Motor': 'motor',
+ 'MotorBoard': 'electronics',
+ 'MotorController': 'electronics',
+ 'MotorMount': 'rocket_drone',
+ 'MountNut': 'robot_base_mount',
+ 'MountScrew': 'robot_base_mount',
+ 'Mounted': 'mounted',
+ 'MountedBoard': 'mounted_board',
+ 'MountedStepper': 'motor_mount',
+ 'MyBox': 'base_box',
+ 'MyPulley': 'driver',
+ 'Nester': 'nesting',
+ 'OpenBox': 'open_box',
+ 'OtherBatt': 'electronics',
+ 'OtherController': 'electronics',
+ 'PCBBoard': 'controller',
+ 'PanTilt': 'pan_tilt',
+ 'PartCache': 'cache',
+ 'PartInst': 'partref',
+ 'PencilCase': 'pencil_case',
+ 'PencilCaseTop': 'pencil_case',
+ 'Pin': 'board_test',
+ 'Pizero': 'controller',
+ 'PizeroBoard': 'mounted_board',
+ 'Placement': 'nesting',
+ 'PlugCover': 'flux_capacitor',
+ 'Printable': 'manufacture',
+ 'ProjectBox': 'project_case',
+ 'Pulley': 'pulley',
+ 'Rails': 'cnc',
+ 'Recorder': 'progress',
+ 'Right': 'box',
+ 'Rim': 'wheel',
+ 'RobotBase': 'robot_base',
+ 'Roller': 'mercanum',
+ 'RollerShaft': 'mercanum',
+ 'Rover': 'robot_base',
+ 'RoverBatt': 'electronics',
+ 'RoverController': 'electronics',
+ 'SVGWriter': 'svg_writer',
+ 'Screen': 'lcd',
+ 'Servo': 'servo',
+ 'ServoArm': 'servo_horns',
+ 'ServoBody': 'servo',
+ 'Shaft': 'shaft',
+ 'SheetLayout': 'nesting',
+ 'Shell': 'shell_test',
+ 'ShortScrew': 'motor_mount',
+ 'ShowHorns': 'servo_horns',
+ 'SimpleBearing': 'roller',
+ 'SimpleWheel': 'wheel',
+ 'SingleArm': 'servo_horns',
+ 'SingleRail': 'mill',
+ 'SmallBox': 'open_box',
+ 'SmallScrew': 'mounted',
+ 'Sonar': 'sonar',
+ 'Spinner': 'rocket_drone',
+ 'SpokeWheel': 'wheel',
+ 'Spokes': 'wheel',
+ 'Standoff': 'mounted_board',
+ 'Stepper': 'stepper',
+ 'StepperBolt': 'turntable',
+ 'StepperCat': 'stepper_cat',
+ 'StepperMount': 'motor_mount',
+ 'SubMicro': 'servo',
+ 'TAxis': 'mill',
+ 'Tank': 'train',
+ 'Template': 'template',
+ 'TestCR': 'control_panel',
+ 'TestGear': 'gear',
+ 'Thing': 'robot_base_mount',
+ 'ThisFastener': 'case',
+ 'ThisScrew': 'case',
+ 'ThisStepper': 'robot_base',
+ 'ThisWheel': 'robot_base',
+ 'ThreadAxis': 'cnc',
+ 'Threaded': 'threaded',
+ 'ThreadedDrive': 'driver',
+ 'Tooth': 'involute',
+ 'Train': 'train',
+ 'TrainAxle': 'train',
+ 'TrainCoupling': 'train',
+ 'TrainCouplingCover': 'train',
+ 'TrainCouplingMagnet': 'train',
+ 'TrainPan': 'train',
+ 'TrainTyre': 'train',
+ 'TrainWheels': 'train',
+ 'Turbine': 'rocket_drone',
+ 'TurbineAssembly': 'rocket_drone',
+ 'TwoArm': 'servo_horns',
+ 'Tyre': 'wheel',
+ 'UNITS': 'SVGexport',
+ 'Wagon': 'train',
+ 'Wheel': 'car',
+ 'WheeledAxle': 'car',
+ 'XAxis': 'mill',
+ 'XDrive': 'mill',
+ 'XSlide': 'mill',
+ 'YellowDisc': 'flux_capacitor',
+ 'YellowPipe': 'flux_capacitor',
+ 'block': 'motor_mount',
+ 'broken': 'bork',
+ 'cabinet': 'flux_capacitor',
+ 'cover': 'flux_capacitor',
+ 'lm8uu': 'linear_bearing',
+ 'plank': 'motor_mount',
+ 'rounded': 'flux_capacitor',
+ 'seal': 'flux_capacitor',
+ 'sertest': 'ser',
+ 'stack': 'bork',
+ 'type1': 'electronics'}
+
+REGISTERED = [('battery', 'CylBattery', {'export': 'battery'}),
+ ('battery', 'AAA', {'export': 'battery'}),
+ ('battery', 'AA', {'export': 'battery'}),
+ ('battery', 'C', {'export': 'battery'}),
+ ('battery', 'D', {'export': 'battery'}),
+ ('battery', 'Li18650', {'export': 'battery'}),
+ ('battery', 'Battpack', {'export': 'battery_pack'}),
+ ('battery', 'FlatBatt', {'export': 'battery_pack'}),
+ ('beard_boss', 'BeardBoss', {'export': 'misc'}),
+ ('boss', 'Boss', {'export': 'shaft'}),
+ ('box', 'Boxen', {'export': 'box'}),
+ ('bucket', 'Bucket', {'export': 'misc'}),
+ ('car', 'Car', {'export': 'car'}),
+ ('case', 'Case', {'export': 'box'}),
+ ('cnc', 'Axis', {'export': 'cnc'}),
+ ('cnc', 'BeltAxis', {'export': 'cnc'}),
+ ('cnc', 'ThreadAxis', {'export': 'cnc'}),
+ ('controller', 'Arduino', {'export': 'controller'}),
+ ('controller', 'Pizero', {'export': 'controller'}),
+ ('controller', 'BeagleBoneBlack', {'export': 'controller'}),
+ ('controller', 'GlasgowRevC', {'export': 'controller'}),
+ ('dc', 'DCMotor', {'export': 'motor'}),
+ ('dc', 'Cylindrical', {'export': 'motor'}),
+ ('dc', 'Rect', {'export': 'motor'}),
+ ('electronics', 'Electronics', {'export': 'electronics'}),
+ ('electronics', 'Electronics', {'export': 'showcase'}),
+ ('electronics', 'type1', {'export': 'electronics'}),
+ ('flip_box', 'FlipBox', {'export': 'box'}),
+ ('flip_box', 'FlipBox', {'export': 'showcase'}),
+ ('flux_capacitor',
+  'CompleteFlux',
+  {'export': 'showcase', 'showcase': 'showcase'}),
+ ('handle', 'Handle', {'export': 'handle'}),
+ ('linear_bearing', 'LinearBearing', {'export': 'linear_bearing'}),
+ ('linear_bearing', 'lm8uu', {'export': 'linear_bearing'}),
+ ('mercanum', 'MercanumWheel', {'export': 'wheel'}),
+ ('mercanum', 'MercanumWheel', {'export': 'showcase'}),
+ ('mill', 'Mill', {'export': 'showcase'}),
+ ('motor_mount', 'MountedStepper', {'export': 'motor', 'showcase': 'showcase'}),
+ ('mounted_board', 'MountedBoard', {'export': 'board'}),
+ ('mounted_board', 'PizeroBoard', {'export': 'board'}),
+ ('mounted_board', 'PizeroBoard', {'export': 'showcase'}),
+ ('mounted_board', 'ArduinoBoard', {'export': 'board'}),
+ ('mounted_board', 'BeagleBoard', {'export': 'board'}),
+ ('open_box', 'OpenBox', {'export': 'box'}),
+ ('pan_tilt', 'PanTilt', {'export': 'sensor'}),
+ ('peg', 'ClothesPeg', {'export': 'misc'}),
+ ('pencil_case', 'PencilCase', {'export': 'box', 'showcase': 'showcase'}),
+ ('project_case', 'ProjectBox', {'export': 'showcase'}),
+ ('robot_base', 'Rover', {'export': 'showcase', 'showcase': 'showcase'}),
+ ('rocket_drone', 'AeroMotor', {'export': 'rocket'}),
+ ('rocket_drone', 'MotorMount', {'export': 'rocket'}),
+ ('rocket_drone', 'Spinner', {'export': 'rocket'}),
+ ('rocket_drone', 'Blade', {'export': 'rocket'}),
+ ('rocket_drone', 'Turbine', {'export': 'rocket'}),
+ ('rocket_drone', 'Cowl', {'export': 'rocket'}),
+ ('rocket_drone', 'TurbineAssembly', {'export': 'rocket'}),
+ ('rocket_drone', 'TurbineAssembly', {'export': 'showcase'}),
+ ('servo', 'Servo', {'export': 'motor'}),
+ ('servo', 'SubMicro', {'export': 'motor'}),
+ ('servo_horns', 'SingleArm', {'export': 'horns'}),
+ ('servo_horns', 'TwoArm', {'export': 'horns'}),
+ ('servo_horns', 'FourArm', {'export': 'horns'}),
+ ('servo_horns', 'ServoArm', {'export': 'horns'}),
+ ('servo_horns', 'Circle', {'export': 'horns'}),
+ ('shaft', 'Shaft', {'export': 'shaft'}),
+ ('shell_test', 'Shell', {'export': 'misc'}),
+ ('simplemount', 'DiscDrive', {'export': 'showcase'}),
+ ('simplemount', 'TurnTable', {'export': 'showcase'}),
+ ('sonar', 'Sonar', {'export': 'sensor'}),
+ ('stepper', 'Stepper', {'export': 'motor'}),
+ ('threaded', 'Threaded', {'export': 'shaft'}),
+ ('train', 'FullLoco', {'export': 'train'}),
+ ('train', 'FullWagon', {'export': 'train'}),
+ ('train', 'FullTank', {'export': 'train'}),
+ ('turntable', 'DiscDrive', {'export': 'showcase'}),
+ ('turntable', 'TurnTable', {'export': 'showcase'}),
+ ('wheel', 'BuiltWheel', {'export': 'wheel'}),
+ ('wheel', 'SpokeWheel', {'export': 'wheel'}),
+ ('wheel', 'SimpleWheel', {'export': 'wheel'})]
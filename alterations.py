@@ -0,0 +1,50 @@
+"""
+Batched cutouts for make_alterations
+
+every .cut() is a full boolean against the target , so cutting twelve
+holes one at a time costs twelve booleans against an ever changing
+solid. The queue collects the cutters per target ( already moved into
+the target's coordinates ) and does one cut of the fused cutters.
+
+    q = CutQueue()
+    q.add(shelf, hole, leg.world_coords)
+    q.add(shelf, leg.make(), leg.world_coords)
+    q.apply()
+"""
+
+from collections import OrderedDict
+
+from . import pattern
+
+# set to False to cut straight away , handy for comparing
+BATCH = True
+
+
+class CutQueue:
+    def __init__(self, batch=None):
+        if batch is None:
+            batch = BATCH
+        self.batch = batch
+        self.targets = OrderedDict()
+
+    def add(self, part, cutter, coords=None):
+        """
+        queue cutter against part , coords is where the cutter lives
+        if it is not already in the part's local coordinates
+        """
+        if cutter is None:
+            return
+        if coords is not None:
+            cutter = (coords - part.world_coords) + cutter
+        if not self.batch:
+            part.local_obj = part.local_obj.cut(cutter)
+            return
+        self.targets.setdefault(id(part), (part, []))[1].append(cutter)
+
+    def apply(self):
+        for part, cutters in self.targets.values():
+            part.local_obj = part.local_obj.cut(pattern.fuse(cutters))
+        self.targets = OrderedDict()
+
+    def __len__(self):
+        return sum(len(c) for p, c in self.targets.values())
@@ -13,6 +13,8 @@ from cqparts.utils.geometry import CoordSystem
 
 from cqparts.search import register
 from .manufacture import Lasercut
+from . import pattern
+from .alterations import CutQueue
 
 # TODO
 # mounting for bolts and nuts
@@ -36,13 +38,12 @@ class _Tab(cqparts.Part):
     count = Int(3)
 
     def make(self):
-        tab = cq.Workplane("XY")
-        for i in range(self.count):
-            incr = self.length / float(2 * self.count)
-            s = cq.Workplane("XZ").rect(incr, self.thickness).extrude(-self.thickness)
-            s = s.translate((incr - self.length / 2 + (2 * i * incr), 0, 0))
-            tab = tab.union(s)
-        return tab
+        incr = self.length / float(2 * self.count)
+        s = cq.Workplane("XZ").rect(incr, self.thickness).extrude(-self.thickness)
+        tabs = pattern.linear(
+            s, self.count, (2 * incr, 0, 0), start=(incr - self.length / 2, 0, 0)
+        )
+        return pattern.fuse(tabs)
 
     def cut(self):
         # TODO some tabs need a cutout
@@ -112,7 +113,10 @@ class _Sheet(Lasercut):
         return s
 
     # cut one board from another
-    def cutter(self, part):
+    def cutter(self, part, queue=None):
+        if queue is not None:
+            queue.add(self, part.local_obj, part.world_coords)
+            return
         self.local_obj.cut((part.world_coords - self.world_coords) + part.local_obj)
 
     # TODO some mates for binding boards
@@ -343,6 +347,12 @@ class Boxen(cqparts.Assembly):
         return constr
 
     def make_alterations(self):
+        q = CutQueue()
+        self.queue_alterations(q)
+        q.apply()
+
+    # subclasses add their own cuts to the same queue
+    def queue_alterations(self, q):
         left = self.components["left"]
         right = self.components["right"]
         bottom = self.components["bottom"]
@@ -351,21 +361,21 @@ class Boxen(cqparts.Assembly):
         front = self.components["front"]
         back = self.components["back"]
 
-        left.cutter(bottom)
-        right.cutter(bottom)
+        left.cutter(bottom, q)
+        right.cutter(bottom, q)
         if self.top is not None:
-            left.cutter(top)
-            right.cutter(top)
-            top.cutter(front)
-            top.cutter(back)
-
-        left.cutter(front)
-        right.cutter(front)
-        bottom.cutter(front)
-
-        left.cutter(back)
-        right.cutter(back)
-        bottom.cutter(back)
+            left.cutter(top, q)
+            right.cutter(top, q)
+            top.cutter(front, q)
+            top.cutter(back, q)
+
+        left.cutter(front, q)
+        right.cutter(front, q)
+        bottom.cutter(front, q)
+
+        left.cutter(back, q)
+        right.cutter(back, q)
+        bottom.cutter(back, q)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,337 @@
+"""
+On disk cache for Part.make()
+
+Parts are keyed on module, class name and serialize_parameters() and
+the made solid is stored as a BREP file, so identical leaf parts
+( TrainTyre, YellowDisc, the _Sheet panels ) load from disk instead
+of being solved again by OCC.
+
+    from cqparts_bucket import cache
+    with cache.caching():
+        display(Train())
+
+the cache is size bounded and evicts the least recently used files.
+
+interning() does the same in memory for a single build, so the two
+tyres on a TrainWheels or the rollers on a MercanumWheel are made once,
+parallel.build runs under it.
+"""
+
+import os
+import ast
+import json
+import hashlib
+import inspect
+from contextlib import contextmanager
+
+import cadquery as cq
+import cqparts
+
+import Part as FreeCADPart
+
+CACHE_DIR = os.environ.get(
+    "CQPARTS_BUCKET_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "cqparts_bucket"),
+)
+MAX_BYTES = 512 * 1024 * 1024
+
+
+def _encode(value):
+    # non json parameters, classes and part instances mostly
+    if isinstance(value, type):
+        return value.__module__ + "." + value.__name__
+    params = getattr(value, "serialize_parameters", None)
+    if params is not None:
+        return {"class": _encode(type(value)), "params": params()}
+    return repr(value)
+
+
+_source_hashes = {}
+
+
+def _imports(fn):
+    """
+    the files of the bucket modules a source file imports , relative
+    ( from .manufacture import ) or absolute from inside the bucket
+    ( import manufacture , from partref import PartRef ) alike
+    """
+    with open(fn, "rb") as f:
+        tree = ast.parse(f.read(), fn)
+    here = os.path.dirname(fn)
+    package = os.path.basename(here)
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [a.name.split(".") for a in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level in (0, 1):
+            module = node.module.split(".") if node.module else []
+            if node.level == 0 and module[:1] != [package]:
+                modules = [module]
+            else:
+                if node.level == 0:
+                    module = module[1:]
+                # from . import a , b or from package import a , b
+                modules = [module] if module else [[a.name] for a in node.names]
+        else:
+            continue
+        for m in modules:
+            if m[:1] == [package]:
+                m = m[1:]
+            if m:
+                names.append(m[0])
+    found = [os.path.join(here, n + ".py") for n in names]
+    return [f for f in found if f != fn and os.path.exists(f)]
+
+
+def _file_hash(fn):
+    " sha1 of a source file and every bucket module it imports "
+    if fn not in _source_hashes:
+        todo = [fn]
+        seen = set()
+        while todo:
+            f = todo.pop()
+            if f in seen:
+                continue
+            seen.add(f)
+            try:
+                todo.extend(_imports(f))
+            except (IOError, OSError, SyntaxError):
+                pass
+        h = hashlib.sha1()
+        for f in sorted(seen):
+            try:
+                with open(f, "rb") as src:
+                    h.update(src.read())
+            except (IOError, OSError):
+                pass
+        _source_hashes[fn] = h.hexdigest()
+    return _source_hashes[fn]
+
+
+def _source_hash(cls):
+    """
+    changing the code of any bucket class in the mro , or of a helper
+    module it imports ( pattern.py , alterations.py ... ) drops the entry
+    """
+    h = hashlib.sha1()
+    for c in inspect.getmro(cls):
+        mod = c.__module__
+        if mod.startswith("cqparts.") or mod in ("builtins", "__builtin__"):
+            continue
+        try:
+            fn = inspect.getsourcefile(c)
+        except TypeError:
+            fn = None
+        if fn:
+            h.update(_file_hash(os.path.abspath(fn)).encode("utf-8"))
+    return h.hexdigest()
+
+
+def part_key(part):
+    " content address for the make() result of a part "
+    cls = type(part)
+    data = {
+        "module": cls.__module__,
+        "class": cls.__name__,
+        "params": part.serialize_parameters(),
+        "source": _source_hash(cls),
+    }
+    blob = json.dumps(data, sort_keys=True, default=_encode)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+
+def shape_to_workplane(shape):
+    " wrap a FreeCAD shape in its own workplane "
+    return cq.Workplane("XY").newObject([cq.Shape.cast(shape)])
+
+
+def workplane_shape(obj):
+    """
+    the FreeCAD shape of a one object workplane , None otherwise , not
+    findSolid() which gives a list of solids for a compound
+    """
+    if len(obj.objects) != 1:
+        return None
+    return getattr(obj.val(), "wrapped", None)
+
+
+class PartCache:
+    def __init__(self, path=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        # bytes on disk , kept up to date by put so it does not list the
+        # directory every time , other processes writing to it are only
+        # seen when it is next over the limit
+        self.total = sum(size for mtime, size, fn in self._entries())
+
+    def filename(self, key):
+        return os.path.join(self.path, key + ".brep")
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith(".brep"):
+                continue
+            fn = os.path.join(self.path, name)
+            try:
+                st = os.stat(fn)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, fn))
+        return entries
+
+    def get(self, key):
+        fn = self.filename(key)
+        if not os.path.exists(fn):
+            self.misses += 1
+            return None
+        try:
+            shape = FreeCADPart.read(fn)
+        except Exception:
+            # half written or corrupt, rebuild it
+            self.total -= os.path.getsize(fn)
+            os.remove(fn)
+            self.misses += 1
+            return None
+        # touch for lru
+        os.utime(fn, None)
+        self.hits += 1
+        return shape_to_workplane(shape)
+
+    def put(self, key, obj):
+        shape = workplane_shape(obj)
+        if shape is None:
+            return
+        fn = self.filename(key)
+        tmp = fn + ".%i.tmp" % os.getpid()
+        shape.exportBrep(tmp)
+        if os.path.exists(fn):
+            self.total -= os.path.getsize(fn)
+        self.total += os.path.getsize(tmp)
+        os.rename(tmp, fn)
+        if self.total > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        entries = sorted(self._entries())
+        total = sum(size for mtime, size, fn in entries)
+        for mtime, size, fn in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(fn)
+            except OSError:
+                pass
+            total -= size
+        self.total = total
+
+    def clear(self):
+        for name in os.listdir(self.path):
+            if name.endswith(".brep"):
+                os.remove(os.path.join(self.path, name))
+        self.total = 0
+
+
+class Interner:
+    """
+    build time sharing of identical parts
+
+    every part with the same key gets its own workplane over one shared
+    shape, cut() swaps the shape on that part only so an alteration
+    leaves the other copies alone ( copy on write ).
+    """
+
+    def __init__(self):
+        self.shapes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        shape = self.shapes.get(key)
+        if shape is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return shape_to_workplane(shape)
+
+    def put(self, key, obj):
+        shape = workplane_shape(obj)
+        if shape is not None:
+            self.shapes[key] = shape
+
+    def clear(self):
+        self.shapes = {}
+
+
+# hook into cqparts.Part.local_obj
+# tiers are looked up in order, memory before disk
+
+_original = cqparts.Part.local_obj
+_tiers = []
+
+
+def _local_obj(self):
+    if (
+        not _tiers
+        or self._local_obj is not None
+        or getattr(self, "_simple", False)
+    ):
+        return _original.fget(self)
+    key = part_key(self)
+    for i, tier in enumerate(_tiers):
+        obj = tier.get(key)
+        if obj is not None:
+            for t in _tiers[:i]:
+                t.put(key, obj)
+            _original.fset(self, obj)
+            return obj
+    obj = _original.fget(self)
+    # only single shape results can be shared
+    if len(obj.objects) == 1:
+        for t in _tiers:
+            t.put(key, obj)
+    return obj
+
+
+def install(tier):
+    if tier not in _tiers:
+        if isinstance(tier, Interner):
+            _tiers.insert(0, tier)
+        else:
+            _tiers.append(tier)
+    cqparts.Part.local_obj = property(_local_obj, _original.fset)
+    return tier
+
+
+def uninstall(tier=None):
+    if tier is None:
+        del _tiers[:]
+    elif tier in _tiers:
+        _tiers.remove(tier)
+    if not _tiers:
+        cqparts.Part.local_obj = _original
+
+
+@contextmanager
+def caching(part_cache=None):
+    if part_cache is None:
+        part_cache = PartCache()
+    install(part_cache)
+    try:
+        yield part_cache
+    finally:
+        uninstall(part_cache)
+
+
+@contextmanager
+def interning():
+    " share geometry between identical parts for one build "
+    interner = install(Interner())
+    try:
+        yield interner
+    finally:
+        uninstall(interner)
@@ -14,6 +14,7 @@ from cqparts.utils.geometry import CoordSystem
 from cqparts_motors.shaft import Shaft
 
 from .servo import SubMicro
+from . import pattern
 
 
 class MountTab(cqparts.Part):
@@ -51,12 +52,9 @@ class Base(cqparts.Part):
 
     def make(self):
         base = cq.Workplane("XY").circle(self.diameter / 2).extrude(self.height)
-        inc = 360 / float(self.mounts)
-        for i in range(self.mounts):
-            t = MountTab().local_obj
-            t = t.translate((-self.diameter / 2, 0, 0))
-            t = t.rotate((0, 0, 0), (0, 0, 1), i * inc)
-            base = base.union(t)
+        t = MountTab().local_obj
+        t = t.translate((-self.diameter / 2, 0, 0))
+        base = pattern.fuse([base] + pattern.polar(t, self.mounts))
         base = base.edges("|Z").fillet(1)
         return base
 
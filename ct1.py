@@ -23,6 +23,8 @@ from cqparts.display import render_props
 from cqparts.constraint import Fixed, Coincident, Mate
 from cqparts.utils.geometry import CoordSystem
 
+from .alterations import CutQueue
+
 
 class CoffeTable(cqparts.Assembly):
     # Basic dimensions
@@ -105,21 +107,16 @@ class CoffeTable(cqparts.Assembly):
         return constraints
 
     def make_alterations(self):
-        # cut out clearance for glasstop
-        self.components["glass_top"].apply_cutout(self.components["leg_0"])
-        self.components["glass_top"].apply_cutout(self.components["leg_1"])
-        self.components["glass_top"].apply_cutout(self.components["leg_2"])
-        self.components["glass_top"].apply_cutout(self.components["leg_3"])
-
-        # cut out hole in shelfs
-        self.components["leg_0"].apply_cutout(self.components["shelf_0"])
-        self.components["leg_0"].apply_cutout(self.components["shelf_1"])
-        self.components["leg_1"].apply_cutout(self.components["shelf_0"])
-        self.components["leg_1"].apply_cutout(self.components["shelf_1"])
-        self.components["leg_2"].apply_cutout(self.components["shelf_0"])
-        self.components["leg_2"].apply_cutout(self.components["shelf_1"])
-        self.components["leg_3"].apply_cutout(self.components["shelf_0"])
-        self.components["leg_3"].apply_cutout(self.components["shelf_1"])
+        q = CutQueue()
+        glass_top = self.components["glass_top"]
+        for i in range(4):
+            leg = self.components["leg_" + str(i)]
+            # cut out clearance for glasstop
+            glass_top.apply_cutout(leg, queue=q)
+            # cut out hole in shelfs
+            leg.apply_cutout(self.components["shelf_0"], queue=q)
+            leg.apply_cutout(self.components["shelf_1"], queue=q)
+        q.apply()
 
 
 class _GlassTop(cqparts.Part):
@@ -138,7 +135,7 @@ class _GlassTop(cqparts.Part):
             .chamfer(3)
         )
 
-    def apply_cutout(self, part):
+    def apply_cutout(self, part, queue=None):
         # A box with a equal clearance on every face
         clearance = 2.0
         foot = 3.0
@@ -149,6 +146,9 @@ class _GlassTop(cqparts.Part):
             centered=(True, True, False),
         )
 
+        if queue is not None:
+            queue.add(part, box, self.world_coords)
+            return
         local_obj = part.local_obj
         local_obj = local_obj.cut((self.world_coords - part.world_coords) + box)
         part.local_obj = local_obj
@@ -307,7 +307,7 @@ class _Leg(cqparts.Part):
 
         return m
 
-    def apply_cutout(self, part):
+    def apply_cutout(self, part, queue=None):
         # A cylinder
         dia = 9.0
         hole = (
@@ -319,6 +319,10 @@ class _Leg(cqparts.Part):
         # The leg itself
         leg = self.make()
 
+        if queue is not None:
+            queue.add(part, hole, self.world_coords)
+            queue.add(part, leg, self.world_coords)
+            return
         local_obj = part.local_obj
         local_obj = local_obj.cut((self.world_coords - part.world_coords) + hole).cut(
             (self.world_coords - part.world_coords) + leg
@@ -0,0 +1,40 @@
+"""
+Time make_alterations one cut at a time against the batched CutQueue
+
+    python -m cqparts_bucket.cut_bench
+"""
+
+import time
+
+from . import alterations
+from . import parallel
+from .ct1 import CoffeTable
+from .turntable import TurnTable
+
+
+def time_alterations(cls, batch):
+    alterations.BATCH = batch
+    try:
+        asm = cls()
+        order = parallel.build_structure(asm)
+        parallel.make_parts(parallel.leaf_parts(asm), processes=1)
+        start = time.time()
+        parallel.make_alterations(order)
+        return time.time() - start
+    finally:
+        alterations.BATCH = True
+
+
+def run(classes=(CoffeTable, TurnTable)):
+    print("%-12s %10s %10s %8s" % ("assembly", "single", "batched", "speedup"))
+    for cls in classes:
+        single = time_alterations(cls, False)
+        batched = time_alterations(cls, True)
+        print(
+            "%-12s %9.2fs %9.2fs %7.1fx"
+            % (cls.__name__, single, batched, single / max(batched, 1e-6))
+        )
+
+
+if __name__ == "__main__":
+    run()
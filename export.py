@@ -0,0 +1,250 @@
+"""
+Export the printable parts of an assembly for the print farm
+
+    python -m cqparts_bucket.export flux_capacitor.CompleteFlux out --format stl
+
+every Printable in the tree is grouped by its _material , identical
+parts ( same class , parameters and cuts ) are written once , the
+writing is done in a process pool , into
+
+    out/<material>/<Class>.stl
+    out/manifest.json           files and how many of each to print
+
+the manifest keeps a hash per part path , a second run only writes the
+parts whose hash changed ( --all writes the lot )
+"""
+
+import os
+import json
+import hashlib
+import argparse
+import importlib
+import multiprocessing
+from collections import OrderedDict
+
+import cqparts
+
+import Part as FreeCADPart
+
+from .manufacture import Printable
+from .extract import Extractor
+from .cache import part_key, shape_to_workplane, workplane_shape
+from . import cache, parallel, stl
+
+FORMATS = ("stl", "step")
+
+# stl tolerance as a fraction of each part's size , finer than the viewer
+QUALITY = 0.0005
+
+
+def _write(job):
+    " runs in the pool "
+    data, filename, fmt = job
+    shape = FreeCADPart.Shape()
+    shape.importBrepFromString(data)
+    if fmt == "stl":
+        stl.export(shape_to_workplane(shape), filename, QUALITY)
+    else:
+        shape.exportStep(filename)
+    return filename
+
+
+def _sha(data):
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def _shape(obj):
+    " one FreeCAD shape for the whole workplane "
+    shape = workplane_shape(obj)
+    if shape is None:
+        shape = FreeCADPart.makeCompound(
+            [o.wrapped for o in obj.objects if hasattr(o, "wrapped")]
+        )
+    return shape
+
+
+def part_hash(part, data):
+    " class , params and the final shape , cuts and all "
+    return _sha(json.dumps([part_key(part), _sha(data)]))
+
+
+class Group:
+    " one file , all the parts that print from it "
+
+    def __init__(self, part, data, hash):
+        self.part = part
+        self.data = data
+        self.hash = hash
+        self.paths = []
+        self.filename = None
+        self.written = False
+
+    def info(self):
+        cls = type(self.part)
+        return {
+            "file": self.filename,
+            "hash": self.hash,
+            "class": cls.__module__ + "." + cls.__name__,
+            "params": self.part.serialize_parameters(),
+            "count": len(self.paths),
+            "paths": self.paths,
+        }
+
+
+def collect(asm, processes=None, cached=True):
+    " material -> OrderedDict of hash -> Group "
+    if isinstance(asm, cqparts.Assembly):
+        # alterations cut the printables , they have to be in
+        if cached:
+            with cache.caching():
+                parallel.build(asm, processes=processes)
+        else:
+            parallel.build(asm, processes=processes)
+    ex = Extractor(breakout=[Printable])
+    ex.scan(asm)
+    materials = OrderedDict()
+    for item in ex.section("Printable"):
+        part = item.part
+        data = _shape(part.local_obj).exportBrepToString()
+        key = part_hash(part, data)
+        groups = materials.setdefault(part._material, OrderedDict())
+        if key not in groups:
+            groups[key] = Group(part, data, key)
+        groups[key].paths.append(item.path or item.name)
+    return materials
+
+
+def _name(taken, material, part, fmt):
+    base = type(part).__name__
+    name = base
+    n = 1
+    while os.path.join(material, name + "." + fmt) in taken:
+        name = "%s_%03i" % (base, n)
+        n += 1
+    return os.path.join(material, name + "." + fmt)
+
+
+def load_manifest(path):
+    try:
+        with open(os.path.join(path, "manifest.json")) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+
+def export(asm, path, fmt="stl", processes=None, incremental=True, cached=True):
+    """
+    write the files and the manifest , returns the manifest
+
+    incremental leaves the files of unchanged parts alone , rewrites the
+    changed ones under their old names and removes the ones that are gone
+    """
+    if fmt not in FORMATS:
+        raise ValueError("format must be one of %s" % (FORMATS,))
+    # the manifest goes here even when there is nothing to print
+    os.makedirs(path, exist_ok=True)
+    materials = collect(asm, processes=processes, cached=cached)
+    # hash -> file and part path -> file from the last run
+    previous = {}
+    by_path = {}
+    old = load_manifest(path) if incremental else None
+    if old is not None and old.get("format") == fmt:
+        for p, entry in old.get("parts", {}).items():
+            previous[entry["hash"]] = entry["file"]
+            by_path[p] = entry["file"]
+    taken = set()
+    changed = []
+    for material, groups in materials.items():
+        folder = os.path.join(path, material)
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        for g in groups.values():
+            fn = previous.get(g.hash)
+            if fn and fn not in taken and os.path.exists(os.path.join(path, fn)):
+                g.filename = fn
+                taken.add(fn)
+            else:
+                changed.append((material, g))
+    for material, g in changed:
+        # the same part keeps its file name
+        for p in g.paths:
+            fn = by_path.get(p)
+            if fn and fn not in taken and fn.startswith(material + os.sep):
+                break
+        else:
+            fn = _name(taken | set(by_path.values()), material, g.part, fmt)
+        g.filename = fn
+        g.written = True
+        taken.add(fn)
+    jobs = [(g.data, os.path.join(path, g.filename), fmt) for m, g in changed]
+    if processes == 1 or len(jobs) < 2:
+        for job in jobs:
+            _write(job)
+    else:
+        pool = multiprocessing.Pool(processes)
+        try:
+            pool.map(_write, jobs, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    removed = []
+    for fn in set(by_path.values()) - taken:
+        if os.path.exists(os.path.join(path, fn)):
+            os.remove(os.path.join(path, fn))
+            removed.append(fn)
+    manifest = OrderedDict()
+    manifest["assembly"] = type(asm).__module__ + "." + type(asm).__name__
+    manifest["params"] = asm.serialize_parameters()
+    manifest["format"] = fmt
+    manifest["written"] = len(jobs)
+    manifest["unchanged"] = sum(len(g) for g in materials.values()) - len(jobs)
+    manifest["removed"] = sorted(removed)
+    manifest["materials"] = OrderedDict()
+    manifest["parts"] = OrderedDict()
+    for material, groups in materials.items():
+        files = [g.info() for g in groups.values()]
+        manifest["materials"][material] = {
+            "parts": sum(f["count"] for f in files),
+            "unique": len(files),
+            "files": files,
+        }
+        for g in groups.values():
+            for p in g.paths:
+                manifest["parts"][p] = {"hash": g.hash, "file": g.filename}
+    with open(os.path.join(path, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2, default=str)
+    return manifest
+
+
+def find_class(classname):
+    module, name = classname.rsplit(".", 1)
+    if not module.startswith("cqparts_bucket."):
+        module = "cqparts_bucket." + module
+    return getattr(importlib.import_module(module), name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="export printable parts")
+    parser.add_argument(
+        "classname", help="module.Class , eg flux_capacitor.CompleteFlux"
+    )
+    parser.add_argument("path", nargs="?", default="export")
+    parser.add_argument("--format", choices=FORMATS, default="stl")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument(
+        "--all", action="store_true", help="write every file , not just the changes"
+    )
+    args = parser.parse_args()
+    m = export(
+        find_class(args.classname)(),
+        args.path,
+        args.format,
+        args.processes,
+        incremental=not args.all,
+    )
+    for material, info in m["materials"].items():
+        print("%-12s %4i parts %4i files" % (material, info["parts"], info["unique"]))
+    print(
+        "%i written %i unchanged %i removed"
+        % (m["written"], m["unchanged"], len(m["removed"]))
+    )
@@ -1,47 +1,100 @@
-import cadquery as cq
+"""
+Extract the parts out of an assembly
+
+one walk over the tree , no recursion , every part is classified by the
+breakout classes ( Lasercut , Printable ) or lands in default. Nothing
+is made until geometry is asked for , so a BOM of a big rover only
+solves the constraints.
+"""
+
 import cqparts
-import math
 from collections import OrderedDict
 
+from .manufacture import Lasercut, Printable
+from . import parallel
+
+
+class Item:
+    " a part found in the tree "
+
+    def __init__(self, name, path, part, section):
+        self.name = name
+        self.path = path
+        self.part = part
+        self.section = section
+
+    @property
+    def world_coords(self):
+        return self.part.world_coords
+
+    @property
+    def local_obj(self):
+        # builds on first access
+        return self.part.local_obj
+
+    @property
+    def bounding_box(self):
+        return self.part.bounding_box
+
+    def __repr__(self):
+        return "<Item %s %s %s>" % (self.section, self.path, type(self.part).__name__)
 
-from manufacture import Lasercut, Printable
 
 # makes an array of local objects
 class Extractor:
-    def __init__(self, breakout=[Lasercut, Printable]):
+    def __init__(self, breakout=[Lasercut, Printable], structure_only=False):
         # for duplicate names
         self.track = {}
+        self.items = []
         self.parts = OrderedDict()
         self.breakout = OrderedDict()
+        # solve the tree without running alterations
+        self.structure_only = structure_only
         for i in breakout:
             section = i.__name__
             self.breakout[section] = i
             self.parts[section] = OrderedDict()
         self.parts["default"] = OrderedDict()
 
-    def scan(self, obj, name):
-        if isinstance(obj, cqparts.Part):
-            if name in self.track:
-                actual_name = name + "_%03i" % self.track[name]
-                self.track[name] += 1
-            else:
-                self.track[name] = 1
-                actual_name = name
-            for i, j in self.breakout.items():
-                if isinstance(obj, j):
-                    self.parts[i][actual_name] = obj
-                    return
-                self.parts["default"][actual_name] = obj
-
-        if isinstance(obj, cqparts.Assembly):
-            for i in obj.components:
-                self.scan(obj.components[i], i)
+    def classify(self, obj):
+        for i, j in self.breakout.items():
+            if isinstance(obj, j):
+                return i
+        return "default"
+
+    def unique_name(self, name):
+        if name in self.track:
+            actual_name = name + "_%03i" % self.track[name]
+            self.track[name] += 1
+        else:
+            self.track[name] = 1
+            actual_name = name
+        return actual_name
+
+    def scan(self, obj, name=""):
+        if self.structure_only and isinstance(obj, cqparts.Assembly):
+            parallel.build_structure(obj)
+        stack = [(name, name, obj)]
+        while stack:
+            name, path, obj = stack.pop()
+            if isinstance(obj, cqparts.Part):
+                section = self.classify(obj)
+                actual_name = self.unique_name(name)
+                self.parts[section][actual_name] = obj
+                self.items.append(Item(actual_name, path, obj, section))
+            elif isinstance(obj, cqparts.Assembly):
+                children = list(obj.components.items())
+                # reversed so they come off the stack in order
+                for i, comp in reversed(children):
+                    stack.append((i, path + "/" + i, comp))
+
+    def section(self, name):
+        return [i for i in self.items if i.section == name]
 
     def show(self):
-        for j in self.parts:
-            i = self.parts[j]
-            area = i.bounding_box.xlen * i.bounding_box.ylen
-            print(i.__class__, i.bounding_box.xlen, i.bounding_box.ylen, area)
+        for i in self.items:
+            bb = i.bounding_box
+            print(i.part.__class__, bb.xlen, bb.ylen, bb.xlen * bb.ylen)
 
     def get_parts(self):
         return self.parts
@@ -7,48 +7,24 @@ Test for part extraction on assemblies
 import cqparts
 
 from .manufacture import Printable, Lasercut
+from .extract import Extractor
 from .robot_base import Rover
 
 from .flux_capacitor import CompleteFlux
 
 
-class Extractor(cqparts.Assembly):
-    parts = []
-    printable = {}
-
-    def scan(self, obj):
-        if isinstance(obj, cqparts.Part):
-            if isinstance(obj, Printable):
-                if obj._material in self.printable:
-                    self.printable[obj._material].append(obj)
-                else:
-                    self.printable[obj._material] = [obj]
-            else:
-                self.parts.append(obj)
-        if isinstance(obj, cqparts.Assembly):
-            for i in obj.components:
-                self.scan(obj.components[i])
-
-    def show(self):
-        # print("Parts")
-        # for i in self.parts:
-        #    print(i.__class__)
-        print("Printable")
-        print(self.printable)
-
-    def get_printable(self):
-        return self.printable
-
-
 m = CompleteFlux()
 # m = Rover()
 # m = Case()
 
 # Extract the printables
-e = Extractor()
+e = Extractor(breakout=[Printable])
 e.scan(m)
-e.show()
-p = e.get_printable()
+p = {}
+for i in e.section("Printable"):
+    p.setdefault(i.part._material, []).append(i.part)
+print("Printable")
+print(p)
 
 from .multi import Arrange
 
@@ -0,0 +1,418 @@
+"""
+Binary glTF ( .glb ) writer
+
+one mesh per distinct part , one node per part carrying its world
+transform , under a root node that turns the bucket's z up into glTF's
+y up. Every mesh has vertex normals , smooth except across edges sharper
+than CREASE.
+
+    data = gltf.export(Boxen())
+
+packed=True is the small one for the web viewer
+
+    positions   int16 relative to the part's bounding box
+                ( KHR_mesh_quantization , the box is a child node matrix )
+    normals     int8 , normalized
+    indices     uint16 where they fit , zigzag delta encoded , the
+                bufferView is marked with extras.delta = bits
+    the lot     zlib compressed
+
+unpack() undoes the last two , show.html has the same in javascript.
+
+parts that look the same ( mesh.shape_key ) are tessellated and stored
+once , every copy is a node pointing at the one mesh. instancing=True
+goes further and draws all the copies from one node
+( EXT_mesh_gpu_instancing ) , one draw call in the viewer.
+"""
+
+import json
+import zlib
+import struct
+from collections import OrderedDict
+
+import numpy as np
+
+from . import mesh, progress
+
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+FLOAT = 5126
+UNSIGNED_INT = 5125
+SHORT = 5122
+UNSIGNED_SHORT = 5123
+
+BYTE = 5120
+# corners sharper than this , in degrees , are shaded flat
+CREASE = 40
+
+# z up to y up
+Z_UP = [1, 0, 0, 0, 0, 0, -1, 0, 0, 1, 0, 0, 0, 0, 0, 1]
+
+
+def _pad(data, fill):
+    return data + fill * ((4 - len(data) % 4) % 4)
+
+
+def delta(indices):
+    " zigzag of the difference to the previous index , same width "
+    signed = {np.dtype(np.uint16): np.int16, np.dtype(np.uint32): np.int32}
+    s = np.diff(indices, prepend=indices.dtype.type(0)).view(signed[indices.dtype])
+    bits = indices.dtype.itemsize * 8
+    return ((s << 1) ^ (s >> (bits - 1))).view(indices.dtype)
+
+
+def undelta(encoded):
+    s = encoded.view({2: np.int16, 4: np.int32}[encoded.dtype.itemsize])
+    d = (encoded >> 1).view(s.dtype) ^ -(s & 1)
+    return np.cumsum(d, dtype=s.dtype).view(encoded.dtype)
+
+
+def _unit(v):
+    length = np.linalg.norm(v, axis=1)
+    length[length == 0] = 1
+    return v / length[:, None]
+
+
+def vertex_normals(positions, indices, crease=CREASE):
+    """
+    smooth normals weighted by the angle of each corner ( so they do not
+    depend on how faces were split into triangles ) , the corners more than
+    crease degrees off them take the flat normal on a vertex of their own
+    ( shared by the triangles of that face ) , returns positions , indices
+    and normals
+    """
+    tris = indices.reshape(-1, 3)
+    p = positions.astype(np.float64)[tris]
+    flat = _unit(np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0]))
+    smooth = np.zeros((len(positions), 3))
+    for k in range(3):
+        a = _unit(p[:, (k + 1) % 3] - p[:, k])
+        b = _unit(p[:, (k + 2) % 3] - p[:, k])
+        angle = np.arccos(np.clip(np.sum(a * b, axis=1), -1, 1))
+        np.add.at(smooth, tris[:, k], flat * angle[:, None])
+    smooth = _unit(smooth)
+    flat = np.repeat(flat, 3, axis=0)
+    corners = tris.reshape(-1)
+    sharp = np.sum(smooth[corners] * flat, axis=1) < np.cos(np.radians(crease))
+    if not sharp.any():
+        return positions, indices, smooth.astype(np.float32)
+    # one new vertex per old vertex and flat normal
+    key = np.column_stack([corners[sharp], np.round(flat[sharp] * 1e4)])
+    key, first, which = np.unique(key, axis=0, return_index=True, return_inverse=True)
+    old = corners[sharp][first]
+    corners = corners.copy()
+    corners[sharp] = len(positions) + which.reshape(-1)
+    positions = np.concatenate([positions, positions[old]])
+    normals = np.concatenate([smooth, flat[sharp][first]])
+    # drop the vertices no corner is left on
+    used, corners = np.unique(corners, return_inverse=True)
+    indices = corners.reshape(indices.shape).astype(indices.dtype)
+    return positions[used], indices, normals[used].astype(np.float32)
+
+
+def quantise_normals(normals, half):
+    """
+    int8 ( n , 4 ) normals for the quantised box , scaled by its half
+    sizes so they come out right through the node matrix ( normals go
+    through its inverse transpose )
+    """
+    n = _unit(normals * half)
+    q = np.zeros((len(n), 4), dtype=np.int8)
+    q[:, :3] = np.round(n * 127)
+    return q
+
+
+def quantise(positions):
+    " int16 positions and the matrix that puts them back "
+    lo = positions.min(axis=0)
+    hi = positions.max(axis=0)
+    center = (lo + hi) / 2.0
+    half = (hi - lo) / 2.0
+    half[half == 0] = 1
+    q = np.zeros((len(positions), 4), dtype=np.int16)
+    q[:, :3] = np.round((positions - center) / half * 32767)
+    hx, hy, hz = half.tolist()
+    cx, cy, cz = center.tolist()
+    # fmt: off
+    m = [
+        hx, 0, 0, 0,
+        0, hy, 0, 0,
+        0, 0, hz, 0,
+        cx, cy, cz, 1,
+    ]
+    # fmt: on
+    return q, m
+
+
+def quaternions(r):
+    """
+    ( n , 3 , 3 ) rotation matrices to ( n , 4 ) x y z w , Shepperd's
+    method , each one is worked out from the largest of the trace and the
+    diagonal so it also holds for half turns
+    """
+    d0, d1, d2 = r[:, 0, 0], r[:, 1, 1], r[:, 2, 2]
+    t = d0 + d1 + d2
+    largest = np.argmax(np.stack([t, d0, d1, d2], axis=1), axis=1)
+    q = np.empty((len(r), 4))
+    i = largest == 0
+    if i.any():
+        m = r[i]
+        s = 2 * np.sqrt(1 + t[i])
+        q[i, 0] = (m[:, 2, 1] - m[:, 1, 2]) / s
+        q[i, 1] = (m[:, 0, 2] - m[:, 2, 0]) / s
+        q[i, 2] = (m[:, 1, 0] - m[:, 0, 1]) / s
+        q[i, 3] = s / 4
+    i = largest == 1
+    if i.any():
+        m = r[i]
+        s = 2 * np.sqrt(1 + d0[i] - d1[i] - d2[i])
+        q[i, 0] = s / 4
+        q[i, 1] = (m[:, 0, 1] + m[:, 1, 0]) / s
+        q[i, 2] = (m[:, 0, 2] + m[:, 2, 0]) / s
+        q[i, 3] = (m[:, 2, 1] - m[:, 1, 2]) / s
+    i = largest == 2
+    if i.any():
+        m = r[i]
+        s = 2 * np.sqrt(1 - d0[i] + d1[i] - d2[i])
+        q[i, 0] = (m[:, 0, 1] + m[:, 1, 0]) / s
+        q[i, 1] = s / 4
+        q[i, 2] = (m[:, 1, 2] + m[:, 2, 1]) / s
+        q[i, 3] = (m[:, 0, 2] - m[:, 2, 0]) / s
+    i = largest == 3
+    if i.any():
+        m = r[i]
+        s = 2 * np.sqrt(1 - d0[i] - d1[i] + d2[i])
+        q[i, 0] = (m[:, 0, 2] + m[:, 2, 0]) / s
+        q[i, 1] = (m[:, 1, 2] + m[:, 2, 1]) / s
+        q[i, 2] = s / 4
+        q[i, 3] = (m[:, 1, 0] - m[:, 0, 1]) / s
+    return q / np.linalg.norm(q, axis=1)[:, None]
+
+
+class GLB:
+    def __init__(self, packed=False):
+        self.packed = packed
+        self.extensions = set()
+        if packed:
+            self.extensions.add("KHR_mesh_quantization")
+        # the dequantise matrix of each packed mesh
+        self._unpack = {}
+        self.doc = {
+            "asset": {"version": "2.0", "generator": "cqparts_bucket"},
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": [{"name": "root", "matrix": Z_UP, "children": []}],
+            "meshes": [],
+            "materials": [],
+            "accessors": [],
+            "bufferViews": [],
+            "buffers": [],
+        }
+        self.chunks = []
+        self.offset = 0
+        self._materials = {}
+
+    def _view(self, data, target, stride=None, extras=None):
+        length = len(data)
+        data = _pad(data, b"\x00")
+        view = {"buffer": 0, "byteOffset": self.offset, "byteLength": length}
+        if target:
+            view["target"] = target
+        if stride:
+            view["byteStride"] = stride
+        if extras:
+            view["extras"] = extras
+        self.doc["bufferViews"].append(view)
+        self.chunks.append(data)
+        self.offset += len(data)
+        return len(self.doc["bufferViews"]) - 1
+
+    def accessor(
+        self, array, kind, target, minmax=False, normalized=False, packed=False
+    ):
+        """
+        add a numpy array , returns the accessor index , rows wider than
+        kind are padding ( for the 4 byte vertex alignment )
+        """
+        component = {
+            np.dtype(np.float32): FLOAT,
+            np.dtype(np.uint32): UNSIGNED_INT,
+            np.dtype(np.int16): SHORT,
+            np.dtype(np.uint16): UNSIGNED_SHORT,
+            np.dtype(np.int8): BYTE,
+        }[array.dtype]
+        width = {"SCALAR": 1, "VEC3": 3, "VEC4": 4}[kind]
+        stride = None
+        if array.ndim == 2 and array.shape[1] != width:
+            stride = array.shape[1] * array.dtype.itemsize
+        if packed:
+            data = delta(array).tobytes()
+            extras = {"delta": array.dtype.itemsize * 8}
+        else:
+            data = array.tobytes()
+            extras = None
+        acc = {
+            "bufferView": self._view(data, target, stride, extras),
+            "componentType": component,
+            "count": len(array),
+            "type": kind,
+        }
+        if normalized:
+            acc["normalized"] = True
+        if minmax:
+            values = array.reshape(len(array), -1)[:, :width]
+            acc["min"] = values.min(axis=0).tolist()
+            acc["max"] = values.max(axis=0).tolist()
+        self.doc["accessors"].append(acc)
+        return len(self.doc["accessors"]) - 1
+
+    def material(self, rgba):
+        if rgba not in self._materials:
+            m = {"pbrMetallicRoughness": {"baseColorFactor": list(rgba)}}
+            if rgba[3] < 1:
+                m["alphaMode"] = "BLEND"
+            self.doc["materials"].append(m)
+            self._materials[rgba] = len(self.doc["materials"]) - 1
+        return self._materials[rgba]
+
+    def add_mesh(self, positions, indices, rgba=None, name=None):
+        if len(indices) == 0:
+            return None
+        positions, indices, normals = vertex_normals(positions, indices.reshape(-1))
+        if self.packed:
+            positions, unpack = quantise(positions)
+            pos = self.accessor(
+                positions, "VEC3", ARRAY_BUFFER, minmax=True, normalized=True
+            )
+            half = np.array([unpack[0], unpack[5], unpack[10]])
+            normals = quantise_normals(normals, half)
+            nor = self.accessor(normals, "VEC3", ARRAY_BUFFER, normalized=True)
+            if len(positions) <= 0xFFFF:
+                indices = indices.astype(np.uint16)
+            idx = self.accessor(indices, "SCALAR", ELEMENT_ARRAY_BUFFER, packed=True)
+        else:
+            pos = self.accessor(positions, "VEC3", ARRAY_BUFFER, minmax=True)
+            nor = self.accessor(normals, "VEC3", ARRAY_BUFFER)
+            idx = self.accessor(indices, "SCALAR", ELEMENT_ARRAY_BUFFER)
+        prim = {"attributes": {"POSITION": pos, "NORMAL": nor}, "indices": idx}
+        if rgba is not None:
+            prim["material"] = self.material(rgba)
+        m = {"primitives": [prim]}
+        if name:
+            m["name"] = name
+        self.doc["meshes"].append(m)
+        index = len(self.doc["meshes"]) - 1
+        if self.packed:
+            self._unpack[index] = unpack
+        return index
+
+    def _node(self, node):
+        self.doc["nodes"].append(node)
+        return len(self.doc["nodes"]) - 1
+
+    def add_node(self, name, mesh_index, matrix):
+        node = {"name": name, "matrix": matrix}
+        if mesh_index in self._unpack:
+            # the quantised box goes back to part coordinates under the part
+            unpack = {"mesh": mesh_index, "matrix": self._unpack[mesh_index]}
+            node["children"] = [self._node(unpack)]
+        elif mesh_index is not None:
+            node["mesh"] = mesh_index
+        self.doc["nodes"][0]["children"].append(self._node(node))
+
+    def add_instances(self, name, mesh_index, matrices):
+        " one node drawing the mesh at every matrix "
+        m = np.array(matrices, dtype=np.float64).reshape(-1, 4, 4)
+        # column major lists
+        m = m.transpose(0, 2, 1)
+        if mesh_index in self._unpack:
+            # the quantised box is folded into each instance
+            m = m @ np.array(self._unpack[mesh_index]).reshape(4, 4).T
+        scale = np.linalg.norm(m[:, :3, :3], axis=1)
+        rotation = m[:, :3, :3] / scale[:, None, :]
+        f = np.float32
+        attributes = {
+            "TRANSLATION": self.accessor(m[:, :3, 3].astype(f), "VEC3", None),
+            "ROTATION": self.accessor(quaternions(rotation).astype(f), "VEC4", None),
+            "SCALE": self.accessor(scale.astype(f), "VEC3", None),
+        }
+        node = {
+            "name": name,
+            "mesh": mesh_index,
+            "extensions": {"EXT_mesh_gpu_instancing": {"attributes": attributes}},
+        }
+        self.extensions.add("EXT_mesh_gpu_instancing")
+        self.doc["nodes"][0]["children"].append(self._node(node))
+
+    def tobytes(self):
+        doc = dict((k, v) for k, v in self.doc.items() if v != [])
+        if self.extensions:
+            doc["extensionsUsed"] = sorted(self.extensions)
+            doc["extensionsRequired"] = sorted(self.extensions)
+        binary = b"".join(self.chunks)
+        if binary:
+            doc["buffers"] = [{"byteLength": len(binary)}]
+        js = _pad(json.dumps(doc, separators=(",", ":")).encode("utf-8"), b" ")
+        chunks = [struct.pack("<I4s", len(js), b"JSON"), js]
+        if binary:
+            chunks += [struct.pack("<I4s", len(binary), b"BIN\x00"), binary]
+        total = 12 + sum(len(c) for c in chunks)
+        data = struct.pack("<4sII", b"glTF", 2, total) + b"".join(chunks)
+        if self.packed:
+            data = zlib.compress(data, 9)
+        return data
+
+
+def unpack(data):
+    " packed bytes back to a plain glb "
+    data = bytearray(zlib.decompress(data))
+    (length,) = struct.unpack_from("<I", data, 12)
+    doc = json.loads(bytes(data[20 : 20 + length]))
+    binary = 20 + length + 8
+    for view in doc.get("bufferViews", []):
+        bits = view.get("extras", {}).get("delta")
+        if not bits:
+            continue
+        start = binary + view.get("byteOffset", 0)
+        dtype = {16: np.uint16, 32: np.uint32}[bits]
+        a = np.frombuffer(data, dtype, view["byteLength"] // (bits // 8), start)
+        data[start : start + a.nbytes] = undelta(a).tobytes()
+    return bytes(data)
+
+
+def tessellate(component, quality=mesh.QUALITY):
+    """
+    shape key -> [ positions , indices , [ ( name , part ) ... ] ] , each
+    shape is tessellated once however many parts share it
+    """
+    found = OrderedDict()
+    seen = {}
+    for name, part in mesh.parts(component):
+        key = mesh.shape_key(part, seen)
+        if key not in found:
+            with progress.stage("tessellate", name=name):
+                positions, indices = mesh.tessellate(part.local_obj, quality)
+            found[key] = [positions, indices, []]
+        found[key][2].append((name, part))
+    return found
+
+
+def encode(found, packed=False, instancing=False):
+    g = GLB(packed)
+    for positions, indices, copies in found.values():
+        name, part = copies[0]
+        if len(copies) > 1:
+            name = type(part).__name__
+        m = g.add_mesh(positions, indices, mesh.color(part), name=name)
+        if instancing and len(copies) > 1 and m is not None:
+            matrices = [mesh.matrix(p.world_coords) for n, p in copies]
+            g.add_instances(name, m, matrices)
+            continue
+        for name, part in copies:
+            g.add_node(name, m, mesh.matrix(part.world_coords))
+    return g.tobytes()
+
+
+def export(component, quality=mesh.QUALITY, packed=False, instancing=False):
+    " glb bytes of a part or assembly , one mesh per distinct part "
+    return encode(tessellate(component, quality), packed, instancing)
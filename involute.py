@@ -7,6 +7,8 @@ from cqparts.constraint import Fixed, Coincident
 from cqparts.constraint import Mate
 from cqparts.utils.geometry import CoordSystem
 
+from . import pattern
+
 
 class Tooth(cqparts.Part):
     thickness = PositiveFloat(3)
@@ -29,13 +31,9 @@ class Involute(cqparts.Part):
     def make(self):
         wp = cq.Workplane("XY")
         post = wp.circle(self.rad).extrude(self.thickness)
-        inc = 360.0 / self.teeth
-        for i in range(self.teeth):
-            print(inc * i)
-            t = Tooth(thickness=self.thickness).local_obj
-            t = t.translate((self.rad, 0, 0))
-            t = t.rotate((0, 0, 0), (0, 0, 1), i * inc)
-            post = post.union(t)
+        t = Tooth(thickness=self.thickness).local_obj
+        t = t.translate((self.rad, 0, 0))
+        post = pattern.fuse([post] + pattern.polar(t, self.teeth))
         return post
 
 
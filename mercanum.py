@@ -15,6 +15,8 @@ from cqparts.search import register
 from cqparts_motors.shaft import Shaft
 import math
 
+from . import pattern
+
 
 def circumradius(sides, radius):
     a = radius * math.cos(math.pi / float(sides))
@@ -153,21 +155,19 @@ class Hub(cqparts.Part):
             .circle(self.hub_diam / 2)
             .extrude(self.thickness)
         )
-        incr = 360.0 / self.rollers
-        for i in range(self.rollers):
-            h = _Mount(
-                roller_clearance=self.roller_clearance,
-                mount_thickness=self.mount_thickness,
-                roller_size=self.roller_diam,
-            ).local_obj
-            h = h.rotate((0, 0, 0), (1, 0, 0), self.angle)
-            h = h.translate(
-                (self.hub_diam / 2 + self.roller_diam + self.roller_clearance, 0, 0)
-            )
-            h = h.rotate((0, 0, 0), (0, 0, 1), i * incr)
-            # reach deep inside each mount and grab the matrix
-            self.mp.append(h.objects[0].wrapped.Matrix)
-            hub = hub.union(h)
+        h = _Mount(
+            roller_clearance=self.roller_clearance,
+            mount_thickness=self.mount_thickness,
+            roller_size=self.roller_diam,
+        ).local_obj
+        h = h.rotate((0, 0, 0), (1, 0, 0), self.angle)
+        h = h.translate(
+            (self.hub_diam / 2 + self.roller_diam + self.roller_clearance, 0, 0)
+        )
+        mounts = pattern.polar(h, self.rollers)
+        # reach deep inside each mount and grab the matrix
+        self.mp = [m.objects[0].wrapped.Matrix for m in mounts]
+        hub = pattern.fuse([hub] + mounts)
         return hub
 
     def roller_mounts(self):
@@ -0,0 +1,221 @@
+"""
+GraphQL over the part catalogue for serve.py
+
+    {
+      parts(category: "type", value: "wheel") {
+        classname
+        build { boundingBox { xmin xmax } meshUrl(lod: "coarse") }
+      }
+    }
+
+every build in a request goes through one DataLoader , so the same class
+and parameters ( defaults filled in ) are built once however many fields
+ask for them , all the builds of a request are handed to the job pool
+before any is waited on , and cached builds come straight back.
+
+needs graphene 2 , flask-graphql and promise , serve.py leaves /graphql
+out without them
+"""
+
+from urllib.parse import urlencode
+
+import graphene
+from graphene.types.generic import GenericScalar
+from promise import Promise
+from promise.dataloader import DataLoader
+from flask_graphql import GraphQLView
+
+from cqparts_bucket.mesh import LODS
+
+
+def classname(cls):
+    return cls.__module__ + "." + cls.__name__
+
+
+class BuildLoader(DataLoader):
+    " one per request "
+
+    def __init__(self, jobs):
+        super(BuildLoader, self).__init__()
+        self.jobs = jobs
+        self.requests = {}
+
+    def load_build(self, classname, params):
+        key = self.jobs.key(classname, params)
+        self.requests[key] = (classname, params)
+        return self.load(key)
+
+    def batch_load_fn(self, keys):
+        # submit the lot before waiting on any of them
+        started = [self.jobs.submit(*self.requests[k]) for k in keys]
+        return Promise.resolve([self._result(job) for job in started])
+
+    def _result(self, job):
+        try:
+            return job.future.result()
+        except Exception as e:
+            # fails that field only
+            return e
+
+
+class BoundingBox(graphene.ObjectType):
+    xmin = graphene.Float()
+    xmax = graphene.Float()
+    ymin = graphene.Float()
+    ymax = graphene.Float()
+    zmin = graphene.Float()
+    zmax = graphene.Float()
+    xlen = graphene.Float()
+    ylen = graphene.Float()
+    zlen = graphene.Float()
+
+    def resolve_xlen(self, info):
+        return self["xmax"] - self["xmin"]
+
+    def resolve_ylen(self, info):
+        return self["ymax"] - self["ymin"]
+
+    def resolve_zlen(self, info):
+        return self["zmax"] - self["zmin"]
+
+
+class Component(graphene.ObjectType):
+    path = graphene.String()
+    classname = graphene.String()
+    bounding_box = graphene.Field(BoundingBox)
+
+
+class Build(graphene.ObjectType):
+    " the summary the worker hands back , see jobs.build "
+    classname = graphene.String()
+    params = GenericScalar()
+    build_time = graphene.Float()
+    mesh_time = graphene.Float()
+    timings = GenericScalar()
+    bounding_box = graphene.Field(BoundingBox)
+    components = graphene.List(Component)
+    mesh_url = graphene.String(lod=graphene.String(), packed=graphene.Boolean())
+
+    def resolve_mesh_url(self, info, lod=None, packed=False):
+        args = dict(self["params"])
+        args["lod"] = lod or next(iter(LODS))
+        if packed:
+            args["packed"] = 1
+        return "/mesh/%s?%s" % (self["classname"], urlencode(sorted(args.items())))
+
+
+class PartClass(graphene.ObjectType):
+    " a class in the catalogue , the root value is the class itself "
+    classname = graphene.String()
+    name = graphene.String()
+    doc = graphene.String()
+    params = GenericScalar()
+    build = graphene.Field(Build, params=GenericScalar())
+
+    def resolve_classname(self, info):
+        return classname(self)
+
+    def resolve_name(self, info):
+        return self.__name__
+
+    def resolve_doc(self, info):
+        return self.__doc__
+
+    def resolve_params(self, info):
+        # the defaults , nothing is built
+        return self().serialize_parameters()
+
+    def resolve_build(self, info, params=None):
+        return info.context["builds"].load_build(classname(self), params or {})
+
+
+def _classes(info, names):
+    classes = info.context["classes"]()
+    return [classes[c] for c in sorted(names, key=lambda c: c.rsplit(".", 1)[1])]
+
+
+class Value(graphene.ObjectType):
+    " root is ( category , value ) "
+    name = graphene.String()
+    parts = graphene.List(PartClass)
+
+    def resolve_name(self, info):
+        return self[1]
+
+    def resolve_parts(self, info):
+        # only the modules of these parts are imported
+        return _classes(info, info.context["index"]()[self[0]][self[1]])
+
+
+class Category(graphene.ObjectType):
+    " root is the category name "
+    name = graphene.String()
+    values = graphene.List(Value)
+
+    def resolve_name(self, info):
+        return self
+
+    def resolve_values(self, info):
+        return [(self, v) for v in info.context["index"]()[self]]
+
+
+class Query(graphene.ObjectType):
+    categories = graphene.List(Category)
+    parts = graphene.List(
+        PartClass, category=graphene.String(), value=graphene.String()
+    )
+    part = graphene.Field(PartClass, classname=graphene.String(required=True))
+    build = graphene.Field(
+        Build, classname=graphene.String(required=True), params=GenericScalar()
+    )
+
+    def resolve_categories(self, info):
+        return list(info.context["index"]().keys())
+
+    def resolve_parts(self, info, category=None, value=None):
+        found = set()
+        for c, values in info.context["index"]().items():
+            if category is not None and c != category:
+                continue
+            for v, names in values.items():
+                if value is None or v == value:
+                    found.update(names)
+        return _classes(info, found)
+
+    def resolve_part(self, info, classname):
+        return info.context["classes"]().get(classname)
+
+    def resolve_build(self, info, classname, params=None):
+        if classname not in info.context["classes"]():
+            raise ValueError("no such class %s" % classname)
+        return info.context["builds"].load_build(classname, params or {})
+
+
+schema = graphene.Schema(query=Query)
+
+
+class View(GraphQLView):
+    jobs = None
+    classes = None
+    index = None
+
+    def get_context(self):
+        return {
+            "builds": BuildLoader(self.jobs),
+            # classname -> class
+            "classes": self.classes,
+            # category -> value -> [ classname ]
+            "index": self.index,
+        }
+
+
+def view(jobs, classes, index):
+    " classes and index are callables , see serve.directory "
+    return View.as_view(
+        "graphql",
+        schema=schema,
+        graphiql=True,
+        jobs=jobs,
+        classes=classes,
+        index=index,
+    )
@@ -0,0 +1,328 @@
+"""
+Build jobs for serve.py
+
+the web process only hands out job ids , the cadquery / OCC work runs in
+a pool of worker processes so one slow Rover does not hold up everyone.
+"""
+
+import time
+import uuid
+import importlib
+import threading
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future
+
+import cqparts
+
+from cqparts_bucket import parallel, gltf, mesh, progress
+
+from lru import BuildCache, make_key
+from meshes import MeshStore
+
+# finished jobs , and their events , are kept this many seconds
+KEEP = 3600
+# and no more than this many jobs at once , the oldest finished go first
+MAX_JOBS = 1000
+
+
+_store = None
+
+
+def mesh_store():
+    " one per worker , it keeps a running size "
+    global _store
+    if _store is None:
+        _store = MeshStore()
+    return _store
+
+
+def find_class(classname):
+    module, name = classname.rsplit(".", 1)
+    return getattr(importlib.import_module(module), name)
+
+
+def mesh_key(key, quality=mesh.QUALITY, packed=False):
+    return "%s@q%g%s" % (key, quality, "/packed" if packed else "")
+
+
+def classname_of(obj):
+    return type(obj).__module__ + "." + type(obj).__name__
+
+
+def box(bb):
+    return {
+        "xmin": bb.xmin,
+        "xmax": bb.xmax,
+        "ymin": bb.ymin,
+        "ymax": bb.ymax,
+        "zmin": bb.zmin,
+        "zmax": bb.zmax,
+    }
+
+
+def describe(o):
+    """
+    world bounding box of the whole thing and of every part in it , None
+    for the parts with no solid ( wires , sketches )
+    """
+    components = []
+    total = None
+    for name, part in mesh.parts(o):
+        obj = part.local_obj
+        if part.world_coords is not None:
+            obj = part.world_coords + obj
+        bb = None
+        # findSolid() is a list for a compound , go through the objects
+        for shape in obj.objects:
+            if hasattr(shape, "Solids") and shape.Solids():
+                b = shape.BoundingBox()
+                bb = b if bb is None else bb.add(b)
+        if bb is not None:
+            total = bb if total is None else total.add(bb)
+        components.append(
+            {
+                "path": name,
+                "classname": classname_of(part),
+                "bounding_box": bb and box(bb),
+            }
+        )
+    return (total and box(total)), components
+
+
+def export_lods(o, key, lods=None):
+    """
+    a glb and a packed one per level of detail , coarsest first , each
+    stored as it is done
+    """
+    if lods is None:
+        lods = mesh.LODS
+    store = mesh_store()
+    shas = {}
+    for name, quality in lods.items():
+        with progress.stage("mesh", lod=name, quality=quality):
+            found = gltf.tessellate(o, quality)
+            shas[name] = store.put(mesh_key(key, quality), gltf.encode(found))
+            # only the viewer reads these , it can draw instances
+            packed = gltf.encode(found, packed=True, instancing=True)
+            store.put(mesh_key(key, quality, packed=True), packed)
+        progress.emit("lod", lod=name, mesh=shas[name])
+    return shas
+
+
+def build(classname, params, job_id=None):
+    " runs in the worker "
+    with progress.tagged(job=job_id), progress.recording() as rec:
+        try:
+            start = time.time()
+            cls = find_class(classname)
+            o = cls(**params)
+            if isinstance(o, cqparts.Assembly):
+                # the pool workers can not have a pool of their own
+                parallel.build(o, processes=1)
+            else:
+                with progress.stage("make", name=cls.__name__):
+                    o.local_obj
+            built = time.time()
+            key = make_key(classname, cls, params)
+            shas = export_lods(o, key)
+            bounding_box, components = describe(o)
+        except Exception as e:
+            progress.emit("end", timings=rec.timings, error=str(e))
+            raise
+        progress.emit("end", timings=rec.timings)
+    return {
+        "classname": classname,
+        "params": params,
+        "build_time": built - start,
+        "mesh_time": time.time() - built,
+        "mesh": shas,
+        "bounding_box": bounding_box,
+        "components": components,
+        "timings": rec.timings,
+    }
+
+
+class Job:
+    def __init__(self, classname, params, future, key=None, job_id=None):
+        self.id = job_id or uuid.uuid4().hex
+        self.classname = classname
+        self.params = params
+        self.key = key
+        self.future = future
+        self.submitted = time.time()
+        self.finished = None
+        self.events = []
+        self.timings = {}
+        self.closed = False
+        self.cond = threading.Condition()
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        self.finished = time.time()
+
+    def add_event(self, ev):
+        with self.cond:
+            self.events.append(ev)
+            if ev["event"] == "finish":
+                name = ev["stage"]
+                self.timings[name] = self.timings.get(name, 0) + ev["elapsed"]
+            if ev["event"] == "end":
+                self.closed = True
+            self.cond.notify_all()
+
+    def close(self, **info):
+        " the end event for jobs that never reach a worker , or lose it "
+        with self.cond:
+            if self.closed:
+                return
+        info["time"] = time.time()
+        self.add_event(dict(info, event="end"))
+
+    def follow(self, timeout=15):
+        """
+        every event so far and then the new ones as they come , None when
+        nothing happened for timeout seconds ( for a keep alive )
+        """
+        i = 0
+        while True:
+            with self.cond:
+                if i == len(self.events) and not self.closed:
+                    self.cond.wait(timeout)
+                new = self.events[i:]
+                closed = self.closed
+            i += len(new)
+            for ev in new:
+                yield ev
+            if closed and i == len(self.events):
+                return
+            if not new:
+                yield None
+
+    @property
+    def state(self):
+        f = self.future
+        if f.running():
+            return "running"
+        if not f.done():
+            return "queued"
+        if f.exception() is not None:
+            return "failed"
+        return "done"
+
+    def info(self):
+        val = {
+            "id": self.id,
+            "state": self.state,
+            "classname": self.classname,
+            "params": self.params,
+            "submitted": self.submitted,
+            "finished": self.finished,
+            "timings": self.timings,
+        }
+        if val["state"] == "failed":
+            e = self.future.exception()
+            val["error"] = "".join(traceback.format_exception_only(type(e), e))
+        return val
+
+
+class Jobs:
+    def __init__(self, workers=None, cache=None, keep=KEEP, max_jobs=MAX_JOBS):
+        # progress events from all the workers come back on one queue
+        self.events = multiprocessing.Queue()
+        self.pool = ProcessPoolExecutor(
+            workers, initializer=progress.to_queue, initargs=(self.events,)
+        )
+        if cache is None:
+            cache = BuildCache()
+        self.cache = cache
+        self.keep = keep
+        self.max_jobs = max_jobs
+        self.jobs = {}
+        # builds in flight by cache key
+        self.pending = {}
+        self.lock = threading.Lock()
+        t = threading.Thread(target=self._drain)
+        t.daemon = True
+        t.start()
+
+    def _drain(self):
+        while True:
+            ev = self.events.get()
+            job = self.get(ev.get("job"))
+            if job is not None:
+                job.add_event(ev)
+
+    def key(self, classname, params):
+        return make_key(classname, find_class(classname), params)
+
+    def failed(self, classname, params, error):
+        " a finished job for a build that could not even be started "
+        future = Future()
+        future.set_exception(error)
+        job = Job(classname, params, future)
+        job.close(error=str(error))
+        with self.lock:
+            self._expire()
+            self.jobs[job.id] = job
+        return job
+
+    def submit(self, classname, params, fn=build, cached=True):
+        try:
+            # makes an instance , bad parameters fail here
+            key = self.key(classname, params)
+        except Exception as e:
+            return self.failed(classname, params, e)
+        with self.lock:
+            job = self.pending.get(key)
+            if job is not None:
+                return job
+            value = None
+            if cached:
+                value = self.cache.get(key)
+            if value is not None:
+                # already built , hand back a finished job
+                future = Future()
+                future.set_result(value)
+                job = Job(classname, params, future, key)
+                job.close(cached=True, timings={})
+            else:
+                job_id = uuid.uuid4().hex
+                future = self.pool.submit(fn, classname, params, job_id)
+                job = Job(classname, params, future, key, job_id)
+                self.pending[key] = job
+            self._expire()
+            self.jobs[job.id] = job
+        # outside the lock , it runs straight away if already done
+        job.future.add_done_callback(lambda f: self._finished(job))
+        return job
+
+    def _finished(self, job):
+        with self.lock:
+            if self.pending.get(job.key) is job:
+                del self.pending[job.key]
+        f = job.future
+        if f.exception() is None:
+            self.cache.put(job.key, f.result())
+        else:
+            # the worker may have died before its end event
+            job.close(error=str(f.exception()))
+
+    def _expire(self):
+        " drops old finished jobs , called with the lock held "
+        now = time.time()
+        done = sorted(
+            (j for j in self.jobs.values() if j.finished is not None),
+            key=lambda j: j.finished,
+        )
+        # room for the one being added
+        over = len(self.jobs) + 1 - self.max_jobs
+        for j in done:
+            if over <= 0 and now - j.finished < self.keep:
+                break
+            del self.jobs[j.id]
+            over -= 1
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
@@ -0,0 +1,68 @@
+"""
+LRU of finished builds for serve.py
+
+keyed on the class name , the full parameter set ( defaults filled in )
+and the source hash of the class , so the same form values , or a form
+that only repeats the defaults , hit the same entry and a code change
+misses.
+
+a result cache , it keeps the summary the worker hands back ( timings ,
+bounding boxes , mesh shas ) and no geometry , the meshes live in the
+MeshStore which has its own size bound. So it is bounded by a count of
+entries.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+
+from cqparts_bucket import cache
+
+
+def normalise(cls, params):
+    " every parameter of the class , as serialized by cqparts "
+    return cls(**params).serialize_parameters()
+
+
+def make_key(classname, cls, params):
+    params = json.dumps(normalise(cls, params), sort_keys=True, default=str)
+    return "%s:%s:%s" % (classname, cache._source_hash(cls), params)
+
+
+class BuildCache:
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = value
+            # oldest out first
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.entries
+
+    def stats(self):
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
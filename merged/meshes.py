@@ -0,0 +1,115 @@
+"""
+Content addressed store of built meshes for serve.py
+
+blobs are named by the sha1 of their bytes , which is also the ETag ,
+and a small index maps build keys ( class + source + params + quality )
+onto them. Workers write , the web process only reads.
+
+the blobs are size bounded , the least recently read go first and the
+index entries that pointed at them with them.
+"""
+
+import os
+import hashlib
+
+MESH_DIR = os.environ.get(
+    "CQPARTS_BUCKET_MESHES",
+    os.path.join(os.path.expanduser("~"), ".cache", "cqparts_bucket", "mesh"),
+)
+MAX_BYTES = int(os.environ.get("CQPARTS_BUCKET_MESH_BYTES", 1024 * 1024 * 1024))
+
+
+class MeshStore:
+    def __init__(self, path=MESH_DIR, max_bytes=MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        for d in ("blobs", "index"):
+            d = os.path.join(path, d)
+            if not os.path.isdir(d):
+                os.makedirs(d)
+        # kept up to date by put , the directory is only listed again
+        # when it goes over , which also picks up the other writers
+        self.total = sum(size for mtime, size, sha in self._blobs())
+
+    def _index(self, key):
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.path, "index", name)
+
+    def blob(self, sha):
+        return os.path.join(self.path, "blobs", sha)
+
+    def _blobs(self):
+        found = []
+        for sha in os.listdir(os.path.join(self.path, "blobs")):
+            if sha.endswith(".tmp"):
+                continue
+            try:
+                st = os.stat(self.blob(sha))
+            except OSError:
+                continue
+            found.append((st.st_mtime, st.st_size, sha))
+        return found
+
+    def _write(self, fn, data):
+        tmp = fn + ".%i.tmp" % os.getpid()
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.rename(tmp, fn)
+
+    def lookup(self, key):
+        " sha of the blob for key , None if it has not been built "
+        try:
+            with open(self._index(key)) as f:
+                sha = f.read().strip()
+        except IOError:
+            return None
+        if not os.path.exists(self.blob(sha)):
+            return None
+        return sha
+
+    def put(self, key, data):
+        sha = hashlib.sha1(data).hexdigest()
+        fn = self.blob(sha)
+        if not os.path.exists(fn):
+            self._write(fn, data)
+            self.total += len(data)
+        self._write(self._index(key), sha.encode("ascii"))
+        if self.total > self.max_bytes:
+            self.evict()
+        return sha
+
+    def read(self, sha):
+        with open(self.blob(sha), "rb") as f:
+            data = f.read()
+        # touch for lru
+        try:
+            os.utime(self.blob(sha), None)
+        except OSError:
+            pass
+        return data
+
+    def evict(self):
+        blobs = sorted(self._blobs())
+        total = sum(size for mtime, size, sha in blobs)
+        gone = set()
+        # oldest out first , always keep the newest
+        for mtime, size, sha in blobs[:-1]:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self.blob(sha))
+            except OSError:
+                pass
+            total -= size
+            gone.add(sha)
+        self.total = total
+        if gone:
+            index = os.path.join(self.path, "index")
+            for name in os.listdir(index):
+                fn = os.path.join(index, name)
+                try:
+                    with open(fn) as f:
+                        if f.read().strip() in gone:
+                            os.remove(fn)
+                except (IOError, OSError):
+                    pass
@@ -1,20 +1,36 @@
 #!/usr/bin/python 
+import os
 import sys
+import json
 # working inside the lib
 sys.path.append('..')
 import cqparts_bucket
 import cqparts
-from cqparts_bucket import * 
 import cqparts.search as cs
-from cqparts.display import display
 
-from flask import Flask, jsonify, abort , render_template, request
+# the bucket's modules are only imported when a part is asked for ,
+# CQPARTS_BUCKET_EAGER=1 imports the lot and uses the cqparts index
+EAGER = bool(os.environ.get('CQPARTS_BUCKET_EAGER'))
+if EAGER:
+    from cqparts_bucket import *
+
+from flask import Flask, jsonify, abort , render_template, request, Response
 
 from anytree import Node , RenderTree , NodeMixin
 from anytree.search import findall
 from anytree.resolver import Resolver
 
 from collections import OrderedDict
+
+from jobs import Jobs, mesh_key
+from cqparts_bucket.mesh import LODS
+from meshes import MeshStore
+try:
+    # graphene 2 , flask-graphql and promise are optional
+    import graph
+except ImportError:
+    graph = None
+
 app = Flask(__name__)
 
 class thing(NodeMixin):
@@ -50,67 +66,101 @@ class thing(NodeMixin):
             l.append(i.info())
         return l
 
+    @property
+    def is_leaf(self):
+        # only the class nodes are leaves , the rest may not be loaded yet
+        return self.classname is not None
+
     def __repr__(self):
         return "<thing: "+self.get_path()+">"
 
+class lazything(thing):
+    " children are made by loader the first time they are asked for "
+    def __init__(self,name,loader=None,parent=None,**kwargs):
+        super(lazything,self).__init__(name,parent=parent,**kwargs)
+        self.loader = loader
+
+    def load(self):
+        if self.loader is not None:
+            loader = self.loader
+            self.loader = None
+            loader(self)
+
+    @property
+    def children(self):
+        self.load()
+        return NodeMixin.children.fget(self)
+
+    @children.setter
+    def children(self,children):
+        NodeMixin.children.fset(self,children)
+
+def classname(k):
+    # from the class , no need to make one
+    return k.__module__+'.'+k.__name__
+
 class directory():
-    def __init__(self,base,name):
-        d = cs.index[name]
-        self.d = d
+    " index is category -> value -> [ classname ] , classes classname -> class "
+    def __init__(self,base,index,classes):
+        self.index = index
+        self.classes = classes
         self.res = Resolver('name')
         self.base = base
-        self.class_dict = {}
-        self.k = {}
-        self.root = thing(base)
-        self.build()
-
-    def build(self):
-        for i in cs.index.keys():
-            p = thing(i,parent=self.root)
-            for j in cs.index[i]:
-                b = thing(j,parent=p)
-                for k in cs.index[i][j]:
-                    cn = type(k()).__module__+'.'+k.__name__
-                    t = thing(k.__name__,parent=b,c=k,classname=cn)
-                    self.class_dict[cn] = t
-                    self.k[self.base+'/'+i+'/'+j+'/'+k.__name__] = t
+        self.root = lazything(base,loader=self.load_categories)
+
+    def load_categories(self,node):
+        for i in self.index.keys():
+            lazything(i,parent=node,loader=self.load_values)
+
+    def load_values(self,node):
+        for j in self.index[node.name]:
+            lazything(j,parent=node,loader=self.load_classes)
+
+    def load_classes(self,node):
+        names = self.index[node.parent.name][node.name]
+        for k in sorted(names,key=lambda c: c.rsplit('.',1)[1]):
+            thing(k.rsplit('.',1)[1],parent=node,classname=k)
+
+    @property
+    def class_dict(self):
+        return self.classes
 
     def children(self,path):
         r = self.res.get(self.root,path)
-        print r
+        print(r)
+
+    def get(self,key):
+        try:
+            return self.res.get(self.root,'/'+key)
+        except Exception:
+            return None
 
     def exists(self,key):
-        if key in self.k:
-            return True
-        return False
+        t = self.get(key)
+        if t is None:
+            return False
+        return t.is_leaf
 
     def prefix(self,key):
         v = self.res.get(self.root,'/'+key)
         return v.dir()
 
     def build_part(self,params):
+        # queue the build , returns the job
         key = params.pop('classname',None)
-        if key in self.class_dict:
-            fixes = {}
-            for i in params:
-                try:
-                    fixes[i] = float(params[i])
-                except:
-                    pass
-            item = self.class_dict[key]
-            o = item.c(**fixes)
-            display(o)
+        if key not in self.class_dict:
+            abort(404)
+        return jobs.submit(key,form_params(params))
 
     def params(self,key):
         if self.exists(key) == False:
             abort(404)
-        t = self.k[key]
-        if t.built == False:
-            t.inst = t.c() 
-            display(t.inst)
-            t.built = True
+        t = self.get(key)
+        # default build goes through the shared cache
+        job = jobs.submit(t.classname,{})
+        t.built = job.state == 'done'
         d = {}
-        pi = t.inst.params().items()
+        pi = self.classes[t.classname]().params().items()
         for i in pi:
             # only grab the floats for now
             if isinstance(i[1],float):
@@ -119,22 +169,36 @@ class directory():
                 d[i] = i[1]
         info = t.info()
         info['params'] = d 
+        info['job'] = job.id
         #if isinstance(t.inst,cqparts.Assembly): 
         #    info['tree'] = t.inst.tree_str()
         return info 
 
 
-#d = directory(cqparts_bucket._namespace,'export')
-d = directory('cqparts','export')
-print(RenderTree(d.root))
+if EAGER:
+    index = {}
+    classes = {}
+    for c,values in cs.index.items():
+        for v,ks in values.items():
+            index.setdefault(c,{})[v] = [classname(k) for k in ks]
+            classes.update((classname(k),k) for k in ks)
+else:
+    index = cqparts_bucket.search_index(None)
+    classes = cqparts_bucket.Classes()
+d = directory('cqparts',index,classes)
+jobs = Jobs()
+meshes = MeshStore()
+if graph is not None:
+    app.add_url_rule('/graphql',view_func=graph.view(jobs,lambda: d.class_dict,lambda: d.index))
 
 @app.route('/')
 def base():
     return render_template('list.html',items=d.root.dir())
 
 @app.route('/list')
-def list():
-    return jsonify(d.items())
+def list_classes():
+    # every buildable classname , none of them imported
+    return jsonify(sorted(d.class_dict))
 
 @app.route('/list/<path:modelname>')
 def subcat(modelname):
@@ -143,14 +207,89 @@ def subcat(modelname):
 @app.route('/show/<path:modelname>')
 def show_model(modelname):
     ob = d.params(modelname)
-    return render_template('show.html',item=d.params(modelname))
-    return jsonify(ob)
+    return render_template('show.html',item=ob,lods=[k for k in LODS])
 
 @app.route('/rebuild',methods=['POST'])
 def rebuild():
-    v = request.form.copy()
-    d.build_part(v)
-    return jsonify(request.form.items())
+    v = request.form.to_dict()
+    job = d.build_part(v)
+    return jsonify(job.info()), 202, {'Location':'/jobs/'+job.id}
+
+@app.route('/jobs/<job_id>')
+def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        abort(404)
+    return jsonify(job.info())
+
+@app.route('/jobs/<job_id>/events')
+def job_events(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        abort(404)
+    def stream():
+        for ev in job.follow():
+            if ev is None:
+                # keep the connection open through proxies
+                yield ': ping\n\n'
+                continue
+            yield 'event: %s\ndata: %s\n\n' % (ev['event'],json.dumps(ev))
+    return Response(stream(),mimetype='text/event-stream',
+        headers={'Cache-Control':'no-cache','X-Accel-Buffering':'no'})
+
+@app.route('/jobs/<job_id>/result')
+def job_result(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        abort(404)
+    if job.state != 'done':
+        return jsonify(job.info()), 409
+    return jsonify(job.future.result())
+
+def form_params(args):
+    fixes = {}
+    for i in args:
+        try:
+            fixes[i] = float(args[i])
+        except:
+            pass
+    return fixes
+
+@app.route('/mesh/<classname>')
+def mesh(classname):
+    if classname not in d.class_dict:
+        abort(404)
+    args = request.args.to_dict()
+    lod = args.pop('lod',next(iter(LODS)))
+    if lod not in LODS:
+        abort(404)
+    # packed is the quantised and compressed one , see gltf.unpack
+    packed = args.pop('packed','0') == '1'
+    params = form_params(args)
+    try:
+        key = jobs.key(classname,params)
+    except Exception as e:
+        job = jobs.failed(classname,params,e)
+        return jsonify(job.info()), 400
+    sha = meshes.lookup(mesh_key(key,LODS[lod],packed))
+    if sha is None:
+        # not built yet , or the blob has gone , build it again
+        job = jobs.submit(classname,params,cached=False)
+        return jsonify(job.info()), 202, {'Location':'/jobs/'+job.id}
+    mimetype = 'application/octet-stream' if packed else 'model/gltf-binary'
+    resp = Response(meshes.read(sha),mimetype=mimetype)
+    # strong etag from the content , always revalidate
+    resp.set_etag(sha)
+    resp.cache_control.no_cache = True
+    return resp.make_conditional(request)
+
+@app.route('/lods')
+def lods():
+    return jsonify(list(LODS.items()))
+
+@app.route('/cache')
+def cache_stats():
+    return jsonify(jobs.cache.stats())
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0',port=8089)
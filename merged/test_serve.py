@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("cqparts")
+pytest.importorskip("cqparts_bucket")
+
+import serve
+
+
+@pytest.fixture
+def client():
+    serve.app.config["TESTING"] = True
+    return serve.app.test_client()
+
+
+def test_lods(client):
+    r = client.get("/lods")
+    assert r.status_code == 200
+    assert [name for name, quality in r.get_json()] == list(serve.LODS)
+
+
+
+def test_list(client):
+    r = client.get("/list")
+    assert r.status_code == 200
+    assert r.get_json() == sorted(serve.d.class_dict)
@@ -0,0 +1,137 @@
+"""
+Triangles for parts and assemblies
+
+used by the web viewer and the exporters , each part is tessellated in
+its own coordinates and carries its world transform alongside.
+
+the tolerance is worked out per part , quality times its bounding box
+diagonal , so an LED and a 480 mm robot base get the same look for
+their size. The angular deflection keeps the curves on big parts round.
+"""
+
+import os
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from .extract import Extractor
+from .cache import part_key
+
+try:
+    import MeshPart
+except ImportError:
+    MeshPart = None
+
+# tolerance as a fraction of the bounding box diagonal
+QUALITY = float(os.environ.get("CQPARTS_BUCKET_QUALITY", 0.001))
+# in mm , whatever the size , parts under 50 mm across all bottom out
+# here , near the old fixed 0.1 so small parts do not blow up
+MIN_TOLERANCE = 0.05
+MAX_TOLERANCE = 1.0
+# radians between neighbouring facets on a curve
+ANGULAR = 0.35
+
+
+def parse_lods(spec):
+    " 'coarse=0.01,medium=0.003,fine=0.001' , coarsest first "
+    lods = OrderedDict()
+    for item in spec.split(","):
+        name, quality = item.split("=")
+        lods[name.strip()] = float(quality)
+    return lods
+
+
+# levels of detail as qualities , the viewer gets the first one first
+_lods = "coarse=%g,medium=%g,fine=%g" % (10 * QUALITY, 3 * QUALITY, QUALITY)
+LODS = parse_lods(os.environ.get("CQPARTS_BUCKET_LODS", _lods))
+
+
+def deflection(shape, quality=QUALITY):
+    " linear deflection for a FreeCAD shape "
+    tol = shape.BoundBox.DiagonalLength * quality
+    return min(max(tol, MIN_TOLERANCE), MAX_TOLERANCE)
+
+
+def _triangles(shape, tol, angular):
+    if MeshPart is not None:
+        m = MeshPart.meshFromShape(
+            Shape=shape, LinearDeflection=tol, AngularDeflection=angular
+        )
+        return m.Topology
+    # no angular limit without MeshPart
+    return shape.tessellate(tol)
+
+
+def tessellate(obj, quality=QUALITY, tolerance=None, angular=ANGULAR):
+    """
+    positions (n, 3) float32 and triangles (m, 3) uint32 of a workplane ,
+    tolerance overrides the one from the quality
+    """
+    positions = [np.zeros((0, 3), dtype=np.float32)]
+    indices = [np.zeros((0, 3), dtype=np.uint32)]
+    offset = 0
+    for shape in obj.objects:
+        if not hasattr(shape, "wrapped"):
+            continue
+        tol = tolerance
+        if tol is None:
+            tol = deflection(shape.wrapped, quality)
+        v, t = _triangles(shape.wrapped, tol, angular)
+        # FreeCAD vectors are sequences , straight into numpy
+        v = np.asarray(v, dtype=np.float32).reshape(-1, 3)
+        t = np.asarray(t, dtype=np.uint32).reshape(-1, 3)
+        positions.append(v)
+        indices.append(t + np.uint32(offset))
+        offset += len(v)
+    return np.concatenate(positions), np.concatenate(indices)
+
+
+def matrix(coords):
+    " 4x4 column major list from a CoordSystem , None is the origin "
+    if coords is None:
+        return [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+    x, y, z, o = coords.xDir, coords.yDir, coords.zDir, coords.origin
+    # fmt: off
+    return [
+        x.x, x.y, x.z, 0,
+        y.x, y.y, y.z, 0,
+        z.x, z.y, z.z, 0,
+        o.x, o.y, o.z, 1,
+    ]
+    # fmt: on
+
+
+def color(part):
+    " rgba 0..1 from the part's render props "
+    r = getattr(part, "_render", None)
+    if r is None:
+        return (0.8, 0.8, 0.8, 1.0)
+    c = r.color
+    return (c[0] / 255.0, c[1] / 255.0, c[2] / 255.0, r.alpha)
+
+
+def shape_key(part, seen=None):
+    """
+    the same key for parts that look the same , class and params and the
+    final shape so a part cut by the alterations gets its own. seen maps
+    id( shape ) to key , parts sharing one shape are not hashed again
+    """
+    shapes = [o.wrapped for o in part.local_obj.objects if hasattr(o, "wrapped")]
+    ids = tuple(id(s) for s in shapes)
+    if seen is not None and ids in seen:
+        return seen[ids]
+    h = hashlib.sha1(part_key(part).encode("utf-8"))
+    for s in shapes:
+        h.update(s.exportBrepToString().encode("utf-8"))
+    key = h.hexdigest()
+    if seen is not None:
+        seen[ids] = key
+    return key
+
+
+def parts(component):
+    " ( path , part ) for every part in a component "
+    ex = Extractor(breakout=[])
+    ex.scan(component)
+    return [(i.path or i.name or type(i.part).__name__, i.part) for i in ex.items]
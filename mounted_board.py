@@ -16,6 +16,7 @@ from .controller import Pizero, BeagleBoneBlack, Arduino
 from .plank import Plank
 
 from partref import PartRef
+from .alterations import CutQueue
 
 
 @register(export="board")
@@ -86,8 +87,12 @@ class MountedBoard(cqparts.Assembly):
         board = self.components["board"]
         print(self)
         if self.target is not None:
+            q = CutQueue()
             for i, j in enumerate(board.mount_verts()):
-                self.components[self.standoff_name(i)].make_cutout(part=self.target)
+                self.components[self.standoff_name(i)].make_cutout(
+                    part=self.target, queue=q
+                )
+            q.apply()
 
     # put the board across
     def mate_transverse(self):
@@ -109,7 +114,10 @@ class Standoff(cqparts.Part):
             so = so.union(hx)
         return so
 
-    def make_cutout(self, part, clearance=0):
+    def make_cutout(self, part, clearance=0, queue=None):
+        if queue is not None:
+            queue.add(part, self.cutout(clearance=clearance), self.world_coords)
+            return
         part = part.local_obj.cut(
             (self.world_coords - part.world_coords) + self.cutout(clearance=clearance)
         )
@@ -0,0 +1,162 @@
+"""
+Nest lasercut parts onto stock sheets
+
+every Lasercut part in an assembly is packed by its tight outline
+rectangle ( see outline.py ) onto a list of stock sheet sizes , turning
+parts by 90 degrees where that fits better. gap is the spacing between
+parts and kerf is the width of the laser cut.
+
+    n = Nester(sheets=[(600, 400), (1200, 600, 2)], gap=3, kerf=0.2)
+    n.add_assembly(Boxen())
+    for sheet in n.pack():
+        print(sheet)
+"""
+
+from collections import namedtuple
+
+from rectpack import newPacker, MaxRectsBssf, PackingBin, SORT_AREA
+
+from .extract import Extractor
+from .manufacture import Lasercut
+from . import outline
+
+# count is how many of that sheet are in stock
+Sheet = namedtuple("Sheet", ["width", "length", "count"])
+
+
+class Placement:
+    " where a part ended up "
+
+    def __init__(self, name, part, rect, x, y, rotated):
+        self.name = name
+        self.part = part
+        self.rect = rect
+        # centre of the part on the sheet
+        self.x = x
+        self.y = y
+        self.rotated = rotated
+
+    @property
+    def angle(self):
+        if self.rotated:
+            return self.rect.angle + 90.0
+        return self.rect.angle
+
+    def offset(self):
+        " translation after rotating the part by angle "
+        if self.rotated:
+            return (self.x + self.rect.cy, self.y - self.rect.cx, 0)
+        return (self.x - self.rect.cx, self.y - self.rect.cy, 0)
+
+    def placed(self):
+        " the part moved onto the sheet "
+        obj = self.part.local_obj.rotate((0, 0, 0), (0, 0, 1), self.angle)
+        return obj.translate(self.offset())
+
+    def __repr__(self):
+        return "<Placement %s (%.1f, %.1f)%s>" % (
+            self.name,
+            self.x,
+            self.y,
+            " rotated" if self.rotated else "",
+        )
+
+
+class SheetLayout:
+    def __init__(self, index, width, length):
+        self.index = index
+        self.width = width
+        self.length = length
+        self.placements = []
+        self.used = 0.0
+
+    @property
+    def utilisation(self):
+        return self.used / float(self.width * self.length)
+
+    def __repr__(self):
+        return "<Sheet %i %gx%g parts=%i used=%.1f%%>" % (
+            self.index,
+            self.width,
+            self.length,
+            len(self.placements),
+            self.utilisation * 100,
+        )
+
+
+class Nester:
+    def __init__(self, sheets=[(600, 400)], gap=3.0, kerf=0.2, rotation=True):
+        self.sheets = []
+        for s in sheets:
+            if len(s) == 2:
+                s = (s[0], s[1], 100)
+            self.sheets.append(Sheet(*s))
+        self.gap = gap
+        self.kerf = kerf
+        self.rotation = rotation
+        # rectpack is much quicker on ints , work in 1/100 mm
+        self.resolution = 100
+        self.parts = []
+        self.unplaced = []
+
+    def add(self, name, part):
+        self.parts.append((name, part))
+
+    def add_assembly(self, obj):
+        ex = Extractor(breakout=[Lasercut])
+        ex.scan(obj)
+        for name, part in ex.get_parts()["Lasercut"].items():
+            self.add(name, part)
+
+    def _int(self, v):
+        return int(round(v * self.resolution))
+
+    def pack(self):
+        packer = newPacker(
+            bin_algo=PackingBin.BFF,
+            pack_algo=MaxRectsBssf,
+            sort_algo=SORT_AREA,
+            rotation=self.rotation,
+        )
+        for i, s in enumerate(self.sheets):
+            packer.add_bin(
+                self._int(s.width), self._int(s.length), count=s.count, bid=i
+            )
+        rects = {}
+        spacing = self.gap + self.kerf
+        for rid, (name, part) in enumerate(self.parts):
+            r = outline.rect(part)
+            rects[rid] = r
+            packer.add_rect(
+                self._int(r.width + spacing), self._int(r.length + spacing), rid
+            )
+        packer.pack()
+
+        layouts = []
+        placed = set()
+        for abin in packer:
+            s = self.sheets[abin.bid]
+            layout = SheetLayout(len(layouts), s.width, s.length)
+            for pr in abin:
+                name, part = self.parts[pr.rid]
+                r = rects[pr.rid]
+                w = self._int(r.width + spacing)
+                rotated = pr.width != w and pr.width != pr.height
+                x = (pr.x + pr.width / 2.0) / self.resolution
+                y = (pr.y + pr.height / 2.0) / self.resolution
+                layout.placements.append(Placement(name, part, r, x, y, rotated))
+                layout.used += part.local_obj.faces("<Z").val().Area()
+                placed.add(pr.rid)
+            layouts.append(layout)
+        self.unplaced = [
+            self.parts[i][0] for i in range(len(self.parts)) if i not in placed
+        ]
+        return layouts
+
+    def report(self, layouts):
+        for l in layouts:
+            print(l)
+            for p in l.placements:
+                print("    ", p)
+        if self.unplaced:
+            print("did not fit", self.unplaced)
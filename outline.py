@@ -0,0 +1,118 @@
+"""
+True outline boxes for lasercut parts
+
+the bounding box of a solid is loose ( it is built from the control
+points ) so nesting wastes sheet. This works off the bottom face
+outline , the same faces("<Z") the svg export cuts , with numpy.
+
+rect() is the smallest rectangle at any angle , bounds() is the tight
+axis aligned one. Results are kept on the part until its shape changes.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+# angle in degrees to rotate the part by so the rectangle is axis aligned
+# cx , cy is the rectangle centre after that rotation
+Rect = namedtuple("Rect", ["width", "length", "angle", "cx", "cy"])
+
+
+def outline_points(part, tolerance=0.1):
+    " 2d points of the tessellated bottom face "
+    face = part.local_obj.faces("<Z").val().wrapped
+    verts, tris = face.tessellate(tolerance)
+    # FreeCAD vectors are sequences , numpy takes them as they are
+    return np.asarray(verts, dtype=float).reshape(-1, 3)[:, :2]
+
+
+def _right_of(a, b, pts):
+    " cross product sign , negative is to the right of a -> b "
+    d = b - a
+    return d[0] * (pts[:, 1] - a[1]) - d[1] * (pts[:, 0] - a[0])
+
+
+def _chain(a, b, pts):
+    " hull points strictly right of a -> b , in order from a to b "
+    out = []
+    # quickhull , every step is one array op over the points left
+    todo = [(a, b, pts)]
+    while todo:
+        item = todo.pop()
+        if len(item) == 1:
+            out.append(item[0])
+            continue
+        a, b, pts = item
+        cross = _right_of(a, b, pts)
+        pts = pts[cross < 0]
+        if not len(pts):
+            continue
+        c = pts[np.argmin(cross[cross < 0])]
+        todo.append((c, b, pts))
+        todo.append((c,))
+        todo.append((a, c, pts))
+    return out
+
+
+def convex_hull(pts):
+    " counter clockwise from the lowest leftmost point , no collinear points "
+    pts = np.unique(pts, axis=0)
+    if len(pts) < 3:
+        return pts
+    # unique sorts them , the ends are the leftmost and rightmost
+    a, b = pts[0], pts[-1]
+    hull = [a] + _chain(a, b, pts) + [b] + _chain(b, a, pts)
+    if len(hull) < 3:
+        # all on one line
+        return np.array([a, b])
+    return np.array(hull)
+
+
+def min_area_rect(pts):
+    " smallest enclosing rectangle , one side is always on a hull edge "
+    hull = convex_hull(pts)
+    if len(hull) < 3:
+        lo = pts.min(axis=0)
+        hi = pts.max(axis=0)
+        c = (lo + hi) / 2
+        return Rect(hi[0] - lo[0], hi[1] - lo[1], 0.0, c[0], c[1])
+    edges = np.roll(hull, -1, axis=0) - hull
+    angles = np.unique(np.mod(-np.arctan2(edges[:, 1], edges[:, 0]), np.pi / 2))
+    cos = np.cos(angles)[:, None]
+    sin = np.sin(angles)[:, None]
+    # every hull point rotated by every candidate angle at once
+    xs = hull[:, 0] * cos - hull[:, 1] * sin
+    ys = hull[:, 0] * sin + hull[:, 1] * cos
+    x0, x1 = xs.min(axis=1), xs.max(axis=1)
+    y0, y1 = ys.min(axis=1), ys.max(axis=1)
+    i = np.argmin((x1 - x0) * (y1 - y0))
+    return Rect(
+        x1[i] - x0[i],
+        y1[i] - y0[i],
+        float(np.degrees(angles[i])),
+        (x0[i] + x1[i]) / 2,
+        (y0[i] + y1[i]) / 2,
+    )
+
+
+def _cached(part, tolerance):
+    # keyed on the workplane itself , alterations swap it out
+    obj = part.local_obj
+    c = getattr(part, "_outline_cache", None)
+    if c is None or c[0] is not obj or c[1] != tolerance:
+        pts = outline_points(part, tolerance)
+        lo = pts.min(axis=0)
+        hi = pts.max(axis=0)
+        c = (obj, tolerance, min_area_rect(pts), (lo, hi))
+        part._outline_cache = c
+    return c
+
+
+def rect(part, tolerance=0.1):
+    return _cached(part, tolerance)[2]
+
+
+def bounds(part, tolerance=0.1):
+    lo, hi = _cached(part, tolerance)[3]
+    c = (lo + hi) / 2
+    return Rect(hi[0] - lo[0], hi[1] - lo[1], 0.0, c[0], c[1])
@@ -0,0 +1,201 @@
+"""
+Parallel assembly build
+
+cqparts builds an assembly one component at a time, make_components ,
+make_constraints and then make_alterations. The leaf make() calls do not
+depend on each other so this splits the build into three passes
+
+    1. components and constraints for the whole tree , no geometry ,
+       Assembly.build is swapped out for the pass so the sub assemblies
+       the solver builds skip their alterations too
+    2. make() every unique leaf part in a process pool , shapes come
+       back as BREP strings
+    3. make_alterations() in the parent , sub assemblies before their
+       parent as cqparts would have run them
+
+the whole build runs under cache.interning() so identical parts made in
+the parent share one shape.
+
+    from cqparts_bucket import parallel
+    parallel.build(CoffeTable(), processes=16)
+"""
+
+import pickle
+import multiprocessing
+from types import GeneratorType
+from contextlib import contextmanager
+from collections import OrderedDict
+
+import cqparts
+
+import Part as FreeCADPart
+
+from .cache import part_key, shape_to_workplane, workplane_shape
+from . import cache, progress
+
+
+def _no_alterations():
+    pass
+
+
+def _timed_solve(asm):
+    solve = asm.solve
+
+    def timed():
+        with progress.stage("solve", name=type(asm).__name__):
+            return solve()
+
+    return timed
+
+
+_build = cqparts.Assembly.build
+
+
+@contextmanager
+def _deferred_alterations(built):
+    """
+    every Assembly.build() in here skips make_alterations , including
+    the ones a parent's solve() sets off on its sub assemblies through
+    _placement_changed , the assemblies are added to built
+    """
+
+    def build(self, recursive=True):
+        self.make_alterations = _no_alterations
+        self.solve = _timed_solve(self)
+        try:
+            with progress.stage("components", name=type(self).__name__):
+                _build(self, recursive=False)
+        finally:
+            del self.make_alterations
+            del self.solve
+        built.append(self)
+
+    cqparts.Assembly.build = build
+    try:
+        yield
+    finally:
+        cqparts.Assembly.build = _build
+
+
+def assemblies(asm):
+    " every assembly in the tree , children before their parent "
+    found = []
+    for name, comp in asm.components.items():
+        if isinstance(comp, cqparts.Assembly):
+            found.extend(assemblies(comp))
+    found.append(asm)
+    return found
+
+
+def build_structure(asm):
+    """
+    solve the whole tree without alterations , returns the assemblies
+    that still need their alterations , children before their parent as
+    cqparts would have run them
+    """
+    built = []
+    with _deferred_alterations(built):
+        # components pulls in the tree , the walk catches anything left
+        tree = assemblies(asm)
+    done = set(map(id, built))
+    in_tree = set(map(id, tree))
+    # ones built on the side , not in the tree , go first
+    order = [a for a in built[::-1] if id(a) not in in_tree]
+    order.extend(a for a in tree if id(a) in done)
+    return order
+
+
+def leaf_parts(asm):
+    " parts anywhere in the tree that still need a make() "
+    parts = []
+    for a in assemblies(asm):
+        for name, comp in a.components.items():
+            if isinstance(comp, cqparts.Part) and comp._local_obj is None:
+                parts.append(comp)
+    return parts
+
+
+def make_alterations(order):
+    " the alterations build_structure left out , in order "
+    for a in order:
+        with progress.stage("alterations", name=type(a).__name__):
+            result = a.make_alterations()
+            # cqparts allows a generator , run it to the end
+            if isinstance(result, GeneratorType):
+                for _ in result:
+                    pass
+
+
+def _make(job):
+    cls, params = job
+    shape = workplane_shape(cls(**params).local_obj)
+    if shape is None:
+        return None
+    return shape.exportBrepToString()
+
+
+def _from_brep(data):
+    shape = FreeCADPart.Shape()
+    shape.importBrepFromString(data)
+    return shape
+
+
+def _picklable(job):
+    try:
+        pickle.dumps(job)
+    except Exception:
+        return False
+    return True
+
+
+def make_parts(parts, processes=None):
+    " make() all the parts , one per unique key "
+    unique = OrderedDict()
+    for p in parts:
+        unique.setdefault(part_key(p), []).append(p)
+    results = dict.fromkeys(unique)
+    if processes != 1:
+        jobs = OrderedDict()
+        for key, same in unique.items():
+            job = (type(same[0]), same[0].params(hidden=True))
+            if _picklable(job):
+                jobs[key] = job
+        if len(jobs) > 1:
+            pool = multiprocessing.Pool(processes)
+            try:
+                done = pool.imap(_make, list(jobs.values()), chunksize=1)
+                for key, data in zip(jobs.keys(), done):
+                    results[key] = data
+                    progress.emit("made", name=type(unique[key][0]).__name__)
+            finally:
+                pool.close()
+                pool.join()
+    for key, same in unique.items():
+        data = results[key]
+        if data is None:
+            # not sent or not a single shape , make it here
+            first = same.pop(0)
+            with progress.stage("make", name=type(first).__name__):
+                obj = first.local_obj
+            shape = workplane_shape(obj)
+            if shape is None:
+                for p in same:
+                    p.local_obj
+                continue
+        else:
+            shape = _from_brep(data)
+        for p in same:
+            p.local_obj = shape_to_workplane(shape)
+
+
+def build(asm, processes=None):
+    # parts made in the parent , the fallbacks and whatever the alterations
+    # make ( cutters , tabs ) , are shared between identical copies
+    with cache.interning():
+        with progress.stage("structure"):
+            order = build_structure(asm)
+        parts = leaf_parts(asm)
+        with progress.stage("parts", count=len(parts)):
+            make_parts(parts, processes=processes)
+        make_alterations(order)
+    return asm
@@ -1,4 +1,3 @@
-
 """ 
 PartRef is used all through this bucket
 
@@ -8,13 +7,28 @@ factor out and make sure that it can be serialized
 from cqparts.params import Parameter
 
 
+def _ref_name(value):
+    # dotted name of a class, or of the class of an instance
+    if not isinstance(value, type):
+        value = type(value)
+    return value.__module__ + "." + value.__name__
+
+
 class PartRef(Parameter):
     def type(self, value):
         return value
 
     @classmethod
     def serialize(cls, value):
-        return cls.__name__
+        if value is None:
+            return None
+        if isinstance(value, type):
+            return _ref_name(value)
+        # an instance, keep its params so different instances differ
+        params = getattr(value, "serialize_parameters", None)
+        if params is None:
+            return _ref_name(value)
+        return {"class": _ref_name(value), "params": params()}
 
 
 # TODO check if it is an instance
@@ -24,4 +38,4 @@ class PartInst(Parameter):
 
     @classmethod
     def serialize(cls, value):
-        return cls.__name__
+        return PartRef.serialize(value)
@@ -0,0 +1,61 @@
+"""
+Pattern helpers
+
+union() in a loop fuses every new piece against the whole accumulated
+solid , so a 60 tooth gear gets slower with every tooth. Build all the
+copies first and fuse them in one go instead.
+
+    teeth = pattern.polar(tooth, 60)
+    gear = pattern.fuse([body] + teeth)
+"""
+
+import cadquery as cq
+
+
+def polar(obj, count, angle=360.0, axis=(0, 0, 1), center=(0, 0, 0)):
+    " count copies of obj rotated about axis , spread over angle degrees "
+    if angle % 360.0 == 0:
+        inc = angle / float(count)
+    else:
+        inc = angle / float(max(count - 1, 1))
+    return [obj.rotate(center, axis, i * inc) for i in range(count)]
+
+
+def linear(obj, count, step, start=(0, 0, 0)):
+    " count copies of obj , start then every step "
+    copies = []
+    for i in range(count):
+        offset = tuple(s + i * d for s, d in zip(start, step))
+        copies.append(obj.translate(offset))
+    return copies
+
+
+def _tree(solids):
+    # balanced pairwise , each boolean is between similar sized pieces
+    while len(solids) > 1:
+        paired = []
+        for i in range(0, len(solids) - 1, 2):
+            paired.append(solids[i].fuse(solids[i + 1]))
+        if len(solids) % 2:
+            paired.append(solids[-1])
+        solids = paired
+    return solids[0]
+
+
+def fuse(objs):
+    " fuse a list of workplanes into one solid "
+    solids = []
+    for o in objs:
+        solids.extend(v.wrapped for v in o.objects if isinstance(v, cq.Shape))
+    if not solids:
+        return cq.Workplane("XY")
+    if len(solids) == 1:
+        shape = solids[0]
+    else:
+        try:
+            # multi argument boolean
+            shape = solids[0].fuse(solids[1:])
+        except Exception:
+            shape = _tree(solids)
+        shape = shape.removeSplitter()
+    return cq.Workplane("XY").newObject([cq.Shape.cast(shape)])
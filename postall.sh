@@ -1,2 +1,5 @@
 #!/bin/bash
-for filename in *.py ; do  python $filename; done
+# smoke build every part and demo , see smoke.py
+# runs from the directory above so the package imports , the reports stay here
+HERE="$(cd "$(dirname "$0")" && pwd)"
+cd "$HERE/.." && python -m cqparts_bucket.registry && python -m cqparts_bucket.smoke --json "$HERE/smoke.json" --html "$HERE/smoke.html" "$@"
@@ -0,0 +1,96 @@
+"""
+Build progress events
+
+the build passes call stage() and emit() , nothing is done with them
+unless something is listening. serve.py listens in its worker processes
+and streams them to the browser , the finish events carry the elapsed
+time so the same stream is the latency breakdown of a build.
+
+    with progress.recording() as rec:
+        parallel.build(Rover())
+    print(rec.timings)
+"""
+
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+_listeners = []
+
+# added to every event , the job id in the serve.py workers
+_tags = {}
+
+
+def listen(fn):
+    _listeners.append(fn)
+
+
+def unlisten(fn):
+    _listeners.remove(fn)
+
+
+def emit(event, **info):
+    " send an event dict to every listener "
+    if not _listeners:
+        return
+    info.update(_tags)
+    info["event"] = event
+    info["time"] = time.time()
+    for fn in list(_listeners):
+        fn(info)
+
+
+@contextmanager
+def stage(stage_name, **info):
+    """
+    start and finish events around a block , finish has the elapsed time ,
+    info may carry a name of its own
+    """
+    emit("start", stage=stage_name, **info)
+    start = time.time()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        emit("finish", stage=stage_name, elapsed=time.time() - start, ok=ok, **info)
+
+
+@contextmanager
+def tagged(**tags):
+    old = dict(_tags)
+    _tags.update(tags)
+    try:
+        yield
+    finally:
+        _tags.clear()
+        _tags.update(old)
+
+
+class Recorder:
+    " keeps the events and the total time per stage "
+
+    def __init__(self):
+        self.events = []
+        self.timings = OrderedDict()
+
+    def __call__(self, ev):
+        self.events.append(ev)
+        if ev["event"] == "finish":
+            name = ev["stage"]
+            self.timings[name] = self.timings.get(name, 0) + ev["elapsed"]
+
+
+@contextmanager
+def recording():
+    rec = Recorder()
+    listen(rec)
+    try:
+        yield rec
+    finally:
+        unlisten(rec)
+
+
+def to_queue(queue):
+    " pool initializer , every event in the worker goes onto the queue "
+    listen(queue.put)
@@ -0,0 +1,86 @@
+"""
+Writes _registry.py , the class -> module map the package uses to
+import things only when they are asked for
+
+    python -m cqparts_bucket.registry
+
+the modules are read with ast , nothing is imported , run it again
+after adding or moving a class ( postall.sh does ).
+"""
+
+import os
+import ast
+import pprint
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+HEADER = "# generated by python -m cqparts_bucket.registry , do not edit\n\n"
+
+# the tools , and the scripts that do their work on import , not parts
+SKIP = ("smoke", "export", "registry", "cut_bench", "get_faces", "extraction_test")
+
+
+def is_register(dec):
+    " @register or @register(...) or @search.register(...) "
+    f = dec.func if isinstance(dec, ast.Call) else dec
+    name = f.attr if isinstance(f, ast.Attribute) else getattr(f, "id", None)
+    return name == "register"
+
+
+def _criteria(dec):
+    found = {}
+    for kw in getattr(dec, "keywords", []):
+        try:
+            found[kw.arg] = ast.literal_eval(kw.value)
+        except ValueError:
+            pass
+    return found
+
+
+def modules(path=HERE):
+    " names of the part modules in path , no tests , tools or scripts "
+    for fn in sorted(os.listdir(path)):
+        if not fn.endswith(".py") or fn.startswith(("_", "test_")):
+            continue
+        if fn[:-3] not in SKIP:
+            yield fn[:-3]
+
+
+def scan(path=HERE):
+    """
+    classes , name -> module for the public classes defined in exactly
+    one module , and registered , [ ( module , class , criteria ) ]
+    """
+    seen = {}
+    registered = []
+    for module in modules(path):
+        fn = module + ".py"
+        try:
+            with open(os.path.join(path, fn)) as f:
+                tree = ast.parse(f.read(), fn)
+        except SyntaxError:
+            continue
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef) or node.name.startswith("_"):
+                continue
+            seen.setdefault(node.name, set()).add(module)
+            for dec in node.decorator_list:
+                if is_register(dec):
+                    registered.append((module, node.name, _criteria(dec)))
+    classes = dict((k, v.pop()) for k, v in seen.items() if len(v) == 1)
+    return classes, registered
+
+
+def generate(path=HERE):
+    classes, registered = scan(path)
+    text = HEADER
+    text += "CLASSES = %s\n\n" % pprint.pformat(classes)
+    text += "REGISTERED = %s\n" % pprint.pformat(registered)
+    with open(os.path.join(path, "_registry.py"), "w") as f:
+        f.write(text)
+    return classes, registered
+
+
+if __name__ == "__main__":
+    classes, registered = generate()
+    print("%i classes , %i registered" % (len(classes), len(registered)))
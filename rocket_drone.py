@@ -10,6 +10,7 @@ from cqparts.utils.geometry import CoordSystem
 
 
 from .dc import Cylindrical
+from . import pattern
 
 
 @register(export="rocket")
@@ -86,13 +87,10 @@ class Turbine(cqparts.Part):
 
     def make(self):
         tb = cq.Workplane("XY").circle(self.diameter / 2).extrude(self.length)
-        bla = cq.Workplane("XY")
-        for i in range(self.blades):
-            bl = Blade(length=self.outer)
-            bl = bl.local_obj.rotate((0, 0, 0), (1, 0, 0), self.pitch)
-            bl = bl.translate((self.diameter / 2, 0, self.lift))
-            bl = bl.rotate((0, 0, 0), (0, 0, 1), i * (360.0 / self.blades))
-            bla = bla.union(bl)
+        bl = Blade(length=self.outer)
+        bl = bl.local_obj.rotate((0, 0, 0), (1, 0, 0), self.pitch)
+        bl = bl.translate((self.diameter / 2, 0, self.lift))
+        bla = pattern.fuse(pattern.polar(bl, self.blades))
         mm = (
             cq.Workplane("XY")
             .circle(self.outer * 2)
@@ -125,19 +123,15 @@ class Cowl(cqparts.Part):
             .circle(self.diameter / 2 - self.thickness)
             .extrude(self.length)
         )
-        for i in range(self.vanes):
-            v = cq.Workplane("XY").rect(rad, self.thickness).extrude(self.vane_height)
-            v = v.translate((rad / 2 + self.motor_diameter / 2, 0, 0))
-            v = v.rotate((0, 0, 0), (0, 0, 1), i * (360.0 / self.vanes))
-
-            pl = pl.union(v)
+        v = cq.Workplane("XY").rect(rad, self.thickness).extrude(self.vane_height)
+        v = v.translate((rad / 2 + self.motor_diameter / 2, 0, 0))
         mm = MotorMount(
             diameter=self.motor_diameter,
             length=self.vane_height,
             thickness=self.thickness,
         )
         mm = mm.local_obj.translate((0, 0, 0))
-        pl = pl.union(mm)
+        pl = pattern.fuse([pl, mm] + pattern.polar(v, self.vanes))
         return pl
 
     def mate_mount(self):
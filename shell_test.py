@@ -13,6 +13,8 @@ from cqparts.constraint import Mate
 from cqparts.utils.geometry import CoordSystem
 from cqparts.search import register
 
+from . import pattern
+
 # base shaft type
 @register(export="misc")
 class Shell(cqparts.Part):
@@ -22,16 +24,13 @@ class Shell(cqparts.Part):
 
     def make(self):
         shft = cq.Workplane("XY").circle(self.diam / 2).extrude(self.length)
-        inc = 360.0 / float(self.count)
-        for i in range(self.count):
-            b = cq.Workplane("XY").circle(self.diam / 4).extrude(self.length / 2)
-            b = b.translate((self.diam / 2, 0, self.length / 8))
-            b = b.rotate((0, 0, 0), (0, 0, 1), float(i * inc))
-            shft = shft.union(b)
-            c = cq.Workplane("XY").circle(self.diam / 8).extrude(self.length - 6)
-            c = c.translate((self.diam / 2, 0, 0))
-            c = c.rotate((0, 0, 0), (0, 0, 1), float(i * inc))
-            shft = shft.union(c)
+        b = cq.Workplane("XY").circle(self.diam / 4).extrude(self.length / 2)
+        b = b.translate((self.diam / 2, 0, self.length / 8))
+        c = cq.Workplane("XY").circle(self.diam / 8).extrude(self.length - 6)
+        c = c.translate((self.diam / 2, 0, 0))
+        shft = pattern.fuse(
+            [shft] + pattern.polar(b, self.count) + pattern.polar(c, self.count)
+        )
         shft = shft.faces(">Z").shell(-1)
         return shft
 
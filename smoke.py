@@ -0,0 +1,279 @@
+"""
+Smoke build everything in the bucket
+
+    python -m cqparts_bucket.smoke --processes 8 --timeout 300
+
+finds every @register'ed part and every module with a __main__ demo
+( by reading the source , nothing is imported to find them ) and builds
+each one in its own forked process , cadquery and cqparts are imported
+once up front so the jobs do not pay for it. display() is swapped for
+one that keeps what it was given.
+
+writes smoke.json and smoke.html , next to this file , with the build
+time , peak memory , triangle count and pass / fail of each , against
+the last run so the slow downs stand out.
+"""
+
+import os
+import ast
+import sys
+import json
+import time
+import runpy
+import argparse
+import resource
+import traceback
+import multiprocessing
+from multiprocessing.connection import wait
+
+from .registry import is_register, modules
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PACKAGE = __package__ or "cqparts_bucket"
+
+# slower than this , times the last run , is flagged
+SLOWER = 1.25
+
+
+def _is_main(node):
+    if not isinstance(node, ast.If):
+        return False
+    t = node.test
+    return (
+        isinstance(t, ast.Compare)
+        and isinstance(t.left, ast.Name)
+        and t.left.id == "__name__"
+        and any(getattr(c, "value", None) == "__main__" for c in t.comparators)
+    )
+
+
+def discover(path=HERE):
+    " [ ( kind , module , name ) ] , kind is part or demo "
+    jobs = []
+    for module in modules(path):
+        fn = module + ".py"
+        try:
+            with open(os.path.join(path, fn)) as f:
+                tree = ast.parse(f.read(), fn)
+        except SyntaxError:
+            jobs.append(("demo", module, None))
+            continue
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                if any(is_register(d) for d in node.decorator_list):
+                    jobs.append(("part", module, node.name))
+            elif _is_main(node):
+                jobs.append(("demo", module, None))
+    return jobs
+
+
+def job_name(job):
+    kind, module, name = job
+    if kind == "part":
+        return "%s.%s" % (module, name)
+    return "%s.__main__" % module
+
+
+def triangles(objs):
+    from . import mesh
+
+    import cqparts
+
+    count = 0
+    for obj in objs:
+        if isinstance(obj, (cqparts.Part, cqparts.Assembly)):
+            for name, part in mesh.parts(obj):
+                count += len(mesh.tessellate(part.local_obj)[1])
+        elif hasattr(obj, "objects"):
+            count += len(mesh.tessellate(obj)[1])
+    return count
+
+
+def run_job(job):
+    " in the forked process , returns the objects that were built "
+    kind, module, name = job
+    import cqparts
+    import cqparts.display
+
+    from . import parallel
+
+    shown = []
+    cqparts.display.display = lambda obj, *args, **kwargs: shown.append(obj)
+    if kind == "part":
+        mod = __import__(PACKAGE + "." + module, fromlist=[name])
+        obj = getattr(mod, name)()
+        if isinstance(obj, cqparts.Assembly):
+            parallel.build(obj, processes=1)
+        else:
+            obj.local_obj
+        return [obj]
+    sys.argv = [module]
+    runpy.run_module(PACKAGE + "." + module, run_name="__main__")
+    return shown
+
+
+def _child(job, conn):
+    start = time.time()
+    result = {"status": "pass"}
+    try:
+        objs = run_job(job)
+        result["build_time"] = time.time() - start
+        result["triangles"] = triangles(objs)
+    except BaseException as e:
+        if isinstance(e, SystemExit) and not e.code:
+            result["build_time"] = time.time() - start
+        else:
+            result["status"] = "fail"
+            result["error"] = traceback.format_exc()
+    result["time"] = time.time() - start
+    # kilobytes on linux
+    result["peak_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    conn.send(result)
+    conn.close()
+
+
+def warm():
+    " the imports every job needs , the forks inherit them "
+    import cadquery
+    import cqparts
+    import cqparts.display
+
+    from . import mesh, parallel
+
+
+def run(jobs, processes=None, timeout=300):
+    " runs the jobs , at most processes at a time , yields the results "
+    ctx = multiprocessing.get_context("fork")
+    processes = processes or multiprocessing.cpu_count()
+    todo = list(jobs)
+    running = {}
+    while todo or running:
+        while todo and len(running) < processes:
+            job = todo.pop(0)
+            recv, send = ctx.Pipe(duplex=False)
+            p = ctx.Process(target=_child, args=(job, send))
+            p.start()
+            send.close()
+            running[recv] = (job, p, time.time())
+        ready = wait(list(running), timeout=1)
+        now = time.time()
+        for conn, (job, p, started) in list(running.items()):
+            result = None
+            if conn in ready:
+                try:
+                    result = conn.recv()
+                except EOFError:
+                    p.join()
+                    result = {"status": "crash", "exitcode": p.exitcode}
+            elif now - started > timeout:
+                p.terminate()
+                result = {"status": "timeout"}
+            if result is None:
+                continue
+            p.join()
+            conn.close()
+            del running[conn]
+            result.setdefault("time", now - started)
+            result["name"] = job_name(job)
+            result["kind"] = job[0]
+            yield result
+
+
+def load(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+
+def compare(results, previous):
+    " adds the last run's time and flags the slow downs "
+    if previous is None:
+        return
+    last = dict((r["name"], r) for r in previous.get("results", []))
+    for r in results:
+        old = last.get(r["name"])
+        if old is None or "build_time" not in old or "build_time" not in r:
+            continue
+        r["previous_time"] = old["build_time"]
+        r["slower"] = r["build_time"] > old["build_time"] * SLOWER
+
+
+ROW = (
+    "<tr class='%(status)s%(slow)s'><td>%(name)s</td><td>%(kind)s</td>"
+    "<td>%(status)s</td><td>%(time)s</td><td>%(previous)s</td>"
+    "<td>%(peak)s</td><td>%(triangles)s</td></tr>\n"
+)
+
+
+def html(report):
+    out = [
+        "<!doctype html><html><head><title>smoke</title><style>",
+        "td{padding:2px 8px} .fail,.crash,.timeout{background:#fcc}",
+        " .slow{background:#ffc}</style></head><body>",
+        "<p>%(passed)i / %(total)i passed in %(wall).1fs</p>" % report,
+        "<table><tr><th>name</th><th>kind</th><th>status</th><th>build s</th>",
+        "<th>last s</th><th>peak MB</th><th>triangles</th></tr>\n",
+    ]
+    rows = sorted(report["results"], key=lambda r: -r.get("build_time", r["time"]))
+    for r in rows:
+        prev = r.get("previous_time")
+        out.append(
+            ROW
+            % {
+                "name": r["name"],
+                "kind": r["kind"],
+                "status": r["status"],
+                "slow": " slow" if r.get("slower") else "",
+                "time": "%.2f" % r.get("build_time", r["time"]),
+                "previous": "" if prev is None else "%.2f" % prev,
+                "peak": "%.0f" % (r["peak_kb"] / 1024.0) if "peak_kb" in r else "",
+                "triangles": r.get("triangles", ""),
+            }
+        )
+    out.append("</table></body></html>\n")
+    return "".join(out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="smoke build the bucket")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--only", default=None, help="names containing this")
+    parser.add_argument("--no-demos", action="store_true")
+    parser.add_argument("--no-parts", action="store_true")
+    parser.add_argument("--json", default=os.path.join(HERE, "smoke.json"))
+    parser.add_argument("--html", default=os.path.join(HERE, "smoke.html"))
+    args = parser.parse_args(argv)
+    jobs = discover()
+    if args.no_demos:
+        jobs = [j for j in jobs if j[0] != "demo"]
+    if args.no_parts:
+        jobs = [j for j in jobs if j[0] != "part"]
+    if args.only:
+        jobs = [j for j in jobs if args.only in job_name(j)]
+    warm()
+    start = time.time()
+    results = []
+    for r in run(jobs, args.processes, args.timeout):
+        print("%-8s %7.2fs %s" % (r["status"], r["time"], r["name"]))
+        results.append(r)
+    compare(results, load(args.json))
+    report = {
+        "started": start,
+        "wall": time.time() - start,
+        "total": len(results),
+        "passed": sum(1 for r in results if r["status"] == "pass"),
+        "results": results,
+    }
+    with open(args.json, "w") as f:
+        json.dump(report, f, indent=2)
+    with open(args.html, "w") as f:
+        f.write(html(report))
+    print("%(passed)i / %(total)i passed in %(wall).1fs" % report)
+    return 0 if report["passed"] == report["total"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
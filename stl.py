@@ -0,0 +1,58 @@
+"""
+Binary STL straight from numpy
+
+    80 byte header , uint32 triangle count , then per triangle the
+    normal and three vertices ( 12 float32 ) and a uint16 attribute
+
+the file is sized up front ( 84 + 50 n bytes ) and memory mapped , the
+triangles go in through a structured view a block at a time , no python
+loop per triangle and no second copy of the mesh.
+
+    stl.export(part.local_obj, "part.stl")
+"""
+
+import numpy as np
+
+from . import mesh
+
+FACET = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
+
+# triangles per block , bounds the temporary arrays
+BLOCK = 1 << 20
+
+
+def normals(triangles):
+    " unit facet normals of ( n , 3 , 3 ) triangles , zero for slivers "
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    n = np.cross(b - a, c - a)
+    length = np.linalg.norm(n, axis=1)
+    length[length == 0] = 1
+    return n / length[:, None]
+
+
+def write(filename, positions, indices, header=b"cqparts_bucket"):
+    " positions ( m , 3 ) and indices ( n , 3 ) as from mesh.tessellate "
+    count = len(indices)
+    out = np.memmap(filename, dtype=np.uint8, mode="w+", shape=(84 + 50 * count,))
+    try:
+        out[:80] = np.frombuffer(header[:80].ljust(80, b" "), dtype=np.uint8)
+        out[80:84] = np.array([count], dtype="<u4").view(np.uint8)
+        facets = out[84:].view(FACET)
+        for start in range(0, count, BLOCK):
+            tris = positions[indices[start : start + BLOCK]]
+            block = facets[start : start + len(tris)]
+            block["normal"] = normals(tris)
+            block["vertices"] = tris
+            block["attribute"] = 0
+        out.flush()
+    finally:
+        del out
+    return count
+
+
+def export(obj, filename, quality=mesh.QUALITY):
+    " tessellate a workplane and write it , returns the triangle count "
+    positions, indices = mesh.tessellate(obj, quality)
+    return write(filename, positions, indices)
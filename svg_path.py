@@ -0,0 +1,169 @@
+"""
+BREP edges straight to svg path commands
+
+no Drawing projection and no xml round trip , the face wires are walked
+and each edge becomes
+
+    line        L
+    circle      A with the right large arc and sweep flags
+    ellipse     A with the major axis angle
+    bspline     C ( or Q / L ) per bezier piece , lines if it is rational
+    anything    else is broken into short lines
+
+coordinates are left as they are ( y up ) , flip them in the svg group.
+The commands are generators so they go straight into SVGWriter.path()
+"""
+
+import math
+
+# deflection for the edges that are broken into lines
+DEFLECTION = 0.05
+
+# FreeCAD renamed the geometry types along the way
+LINES = ("GeomLineSegment", "LineSegment", "Line", "GeomLine")
+CIRCLES = ("GeomCircle", "Circle")
+ELLIPSES = ("GeomEllipse", "Ellipse")
+SPLINES = ("GeomBSplineCurve", "BSplineCurve", "GeomBezierCurve", "BezierCurve")
+
+
+def _xy(v):
+    return (v.x, v.y)
+
+
+def _dist(a, b):
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+
+def _ends(edge):
+    return (
+        _xy(edge.valueAt(edge.FirstParameter)),
+        _xy(edge.valueAt(edge.LastParameter)),
+    )
+
+
+def _arc(edge, reverse, rx, ry, rotation):
+    span = edge.LastParameter - edge.FirstParameter
+    # the curve runs counter clockwise about its axis
+    ccw = edge.Curve.Axis.z > 0
+    if reverse:
+        ccw = not ccw
+    sweep = 1 if ccw else 0
+    first, last = edge.FirstParameter, edge.LastParameter
+    if reverse:
+        first, last = last, first
+    if span >= 2 * math.pi - 1e-9:
+        # a full circle needs two arcs
+        mid = _xy(edge.valueAt((first + last) / 2.0))
+        end = _xy(edge.valueAt(last))
+        yield ("A", (rx, ry, rotation, 0, sweep) + mid)
+        yield ("A", (rx, ry, rotation, 0, sweep) + end)
+        return
+    large = 1 if span > math.pi else 0
+    yield ("A", (rx, ry, rotation, large, sweep) + _xy(edge.valueAt(last)))
+
+
+def _ellipse_rotation(curve):
+    # parameter 0 is on the major axis
+    p = curve.value(0)
+    c = curve.Center
+    return math.degrees(math.atan2(p.y - c.y, p.x - c.x))
+
+
+def _bezier(poles, reverse):
+    if reverse:
+        poles = poles[::-1]
+    pts = [_xy(p) for p in poles[1:]]
+    if len(pts) == 1:
+        return ("L", pts[0])
+    if len(pts) == 2:
+        return ("Q", pts[0] + pts[1])
+    return ("C", pts[0] + pts[1] + pts[2])
+
+
+def _spline(edge, reverse):
+    if edge.Curve.isRational():
+        # svg beziers have no weights , a weighted curve is not its poles
+        for cmd in _lines(edge, reverse):
+            yield cmd
+        return
+    curve = edge.Curve.copy()
+    curve.segment(edge.FirstParameter, edge.LastParameter)
+    if hasattr(curve, "toBezier"):
+        pieces = curve.toBezier()
+    else:
+        pieces = [curve]
+    if any(b.Degree > 3 for b in pieces):
+        for cmd in _lines(edge, reverse):
+            yield cmd
+        return
+    if reverse:
+        pieces = pieces[::-1]
+    for b in pieces:
+        yield _bezier(b.getPoles(), reverse)
+
+
+def _lines(edge, reverse):
+    pts = edge.discretize(Deflection=DEFLECTION)
+    if reverse:
+        pts = pts[::-1]
+    for p in pts[1:]:
+        yield ("L", _xy(p))
+
+
+def edge_commands(edge, reverse=False):
+    " commands from the start of the edge ( already drawn ) to its end "
+    kind = type(edge.Curve).__name__
+    if kind in LINES:
+        yield ("L", _ends(edge)[0 if reverse else 1])
+    elif kind in CIRCLES:
+        r = edge.Curve.Radius
+        for cmd in _arc(edge, reverse, r, r, 0):
+            yield cmd
+    elif kind in ELLIPSES:
+        c = edge.Curve
+        rot = _ellipse_rotation(c)
+        for cmd in _arc(edge, reverse, c.MajorRadius, c.MinorRadius, rot):
+            yield cmd
+    elif kind in SPLINES:
+        for cmd in _spline(edge, reverse):
+            yield cmd
+    else:
+        for cmd in _lines(edge, reverse):
+            yield cmd
+
+
+def wire_commands(wire):
+    " one closed sub path "
+    edges = wire.OrderedEdges
+    if not edges:
+        return
+    # start at the end of the first edge that does not join the second
+    a, b = _ends(edges[0])
+    reverse = False
+    if len(edges) > 1:
+        na, nb = _ends(edges[1])
+        if min(_dist(a, na), _dist(a, nb)) < min(_dist(b, na), _dist(b, nb)):
+            reverse = True
+    pen = b if reverse else a
+    yield ("M", pen)
+    for edge in edges:
+        a, b = _ends(edge)
+        reverse = _dist(pen, b) < _dist(pen, a)
+        for cmd in edge_commands(edge, reverse):
+            yield cmd
+        pen = a if reverse else b
+    yield ("Z", ())
+
+
+def face_commands(face):
+    " all the wires of a face , outer first , holes after "
+    outer = face.OuterWire
+    wires = [outer] + [w for w in face.Wires if not w.isSame(outer)]
+    for w in wires:
+        for cmd in wire_commands(w):
+            yield cmd
+
+
+def part_commands(obj):
+    " the bottom face of a workplane "
+    return face_commands(obj.faces("<Z").val().wrapped)
@@ -0,0 +1,99 @@
+"""
+Streaming svg output
+
+paths are written to the file as they are made , nothing is joined up
+in memory , so a sheet with thousands of edges is linear time and the
+memory use does not grow with the drawing.
+
+    with open("sheet.svg", "w") as f:
+        svg = SVGWriter(f, 600, 400)
+        svg.path([("M", (0, 0)), ("L", (10, 0)), ("L", (10, 10)), ("Z", ())])
+        svg.close()
+"""
+
+HEADER = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="%(width)s%(units)s" height="%(height)s%(units)s" viewBox="0 0 %(width)s %(height)s">
+<g transform="%(transform)s" stroke="%(stroke)s" stroke-width="%(stroke_width)s" fill="none">
+"""
+
+FOOTER = """</g>
+</svg>
+"""
+
+
+def fmt(v, places=3):
+    " shortest text for a number , 1.500 -> 1.5 , -0.000 -> 0 "
+    s = "%.*f" % (places, v)
+    if "." in s:
+        s = s.rstrip("0").rstrip(".")
+    if s == "-0":
+        s = "0"
+    return s
+
+
+class SVGWriter:
+    def __init__(
+        self,
+        f,
+        width,
+        height,
+        units="mm",
+        transform="",
+        stroke="black",
+        stroke_width=0.1,
+        places=3,
+    ):
+        self.f = f
+        self.places = places
+        self.paths = 0
+        f.write(
+            HEADER
+            % {
+                "width": fmt(width),
+                "height": fmt(height),
+                "units": units,
+                "transform": transform,
+                "stroke": stroke,
+                "stroke_width": fmt(stroke_width),
+            }
+        )
+
+    def raw_path(self, d):
+        " a path whose d is already a string "
+        self.f.write('<path d="%s"/>\n' % d)
+        self.paths += 1
+
+    def path(self, commands, **attrs):
+        """
+        commands is any iterable of ( letter , numbers ) , a generator
+        straight off the edges is best
+        """
+        w = self.f.write
+        w('<path d="')
+        first = True
+        for cmd, values in commands:
+            if not first:
+                w(" ")
+            first = False
+            w(cmd)
+            for v in values:
+                w(" ")
+                w(fmt(v, self.places))
+        w('"')
+        for k, v in attrs.items():
+            w(' %s="%s"' % (k.replace("_", "-"), v))
+        w("/>\n")
+        self.paths += 1
+
+    def group(self, transform="", **attrs):
+        w = self.f.write
+        w('<g transform="%s"' % transform)
+        for k, v in attrs.items():
+            w(' %s="%s"' % (k.replace("_", "-"), v))
+        w(">\n")
+
+    def end_group(self):
+        self.f.write("</g>\n")
+
+    def close(self):
+        self.f.write(FOOTER)
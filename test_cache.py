@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("cadquery")
+pytest.importorskip("cqparts")
+
+from . import cache
+
+
+def write(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+@pytest.fixture
+def bucket(tmp_path):
+    d = tmp_path / "bucket"
+    d.mkdir()
+    write(d / "base.py", "import os\nfrom helper import thing\n")
+    write(d / "helper.py", "thing = 1\n")
+    write(d / "plain.py", "x = 1\n")
+    write(d / "relative.py", "from . import plain\n")
+    write(d / "other.py", "from bucket.relative import x\nimport bucket.plain\n")
+    write(d / "os.py", "")
+    cache._source_hashes.clear()
+    yield d
+    cache._source_hashes.clear()
+
+
+def names(files):
+    return sorted(f.rsplit("/", 1)[1] for f in files)
+
+
+def test_imports(bucket):
+    # os.py is in the folder so it counts , cqparts is not
+    assert names(cache._imports(str(bucket / "base.py"))) == ["helper.py", "os.py"]
+    assert names(cache._imports(str(bucket / "relative.py"))) == ["plain.py"]
+    assert names(cache._imports(str(bucket / "other.py"))) == [
+        "plain.py",
+        "relative.py",
+    ]
+
+
+@pytest.mark.parametrize("edited", ["helper.py", "base.py"])
+def test_editing_a_sibling_changes_the_hash(bucket, edited):
+    fn = str(bucket / "base.py")
+    before = cache._file_hash(fn)
+    cache._source_hashes.clear()
+    assert cache._file_hash(fn) == before
+    (bucket / edited).write_text("thing = 2\n")
+    cache._source_hashes.clear()
+    assert cache._file_hash(fn) != before
+
+
+def test_transitive(bucket):
+    fn = str(bucket / "other.py")
+    before = cache._file_hash(fn)
+    (bucket / "plain.py").write_text("x = 2\n")
+    cache._source_hashes.clear()
+    assert cache._file_hash(fn) != before
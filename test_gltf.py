@@ -0,0 +1,218 @@
+import json
+import struct
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cqparts")
+
+from .gltf import GLB, delta, undelta, quantise, quaternions, unpack, vertex_normals
+
+
+def to_matrix(q):
+    " ( n , 4 ) x y z w back to ( n , 3 , 3 ) "
+    x, y, z, w = q.T
+    return np.stack(
+        [
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ]
+    ).transpose(2, 0, 1)
+
+
+def half_turn(axis):
+    " 180 degrees about axis "
+    a = np.array(axis, dtype=float)
+    a /= np.linalg.norm(a)
+    return 2 * np.outer(a, a) - np.eye(3)
+
+
+def random_rotations(n, seed=0):
+    rng = np.random.RandomState(seed)
+    q, r = np.linalg.qr(rng.normal(size=(n, 3, 3)))
+    q *= np.sign(np.diagonal(r, axis1=1, axis2=2))[:, None, :]
+    q[np.linalg.det(q) < 0, :, 0] *= -1
+    return q
+
+
+@pytest.mark.parametrize("dtype", [np.uint16, np.uint32])
+def test_delta_round_trip(dtype):
+    rng = np.random.RandomState(2)
+    info = np.iinfo(dtype)
+    indices = rng.randint(0, info.max, size=5000, dtype=np.int64).astype(dtype)
+    # the extremes wrap around in the difference
+    indices[:4] = [0, info.max, 0, info.max]
+    encoded = delta(indices)
+    assert encoded.dtype == indices.dtype
+    assert np.array_equal(undelta(encoded), indices)
+
+
+def test_delta_is_small_for_neighbours():
+    indices = np.array([10, 11, 12, 11, 13, 12], dtype=np.uint16)
+    assert delta(indices).tolist() == [20, 2, 2, 1, 4, 1]
+
+
+def test_quantise():
+    rng = np.random.RandomState(3)
+    positions = rng.uniform(-50, 120, size=(1000, 3)).astype(np.float32)
+    positions[:, 2] = 4.0
+    q, m = quantise(positions)
+    m = np.array(m).reshape(4, 4).T
+    # normalized int16 is divided by 32767 , then the matrix
+    back = q[:, :3] / 32767.0 * np.diag(m)[:3] + m[:3, 3]
+    assert np.abs(back - positions).max() < 170 / 32767.0
+    assert np.allclose(back[:, 2], 4.0)
+
+
+def test_quaternions_random():
+    r = random_rotations(500)
+    q = quaternions(r)
+    assert np.allclose(np.linalg.norm(q, axis=1), 1)
+    assert np.allclose(to_matrix(q), r, atol=1e-9)
+
+
+@pytest.mark.parametrize(
+    "axis", [(1, 0, 0), (0, 1, 0), (0, 0, 1), (1, -1, 0), (1, 1, 1), (0, 3, -1)]
+)
+def test_quaternions_half_turns(axis):
+    r = half_turn(axis)[None]
+    q = quaternions(r)
+    assert np.allclose(to_matrix(q), r, atol=1e-9)
+    # no rotation part left , the axis is the vector
+    assert np.isclose(q[0, 3], 0)
+
+
+def test_quaternions_half_turn_sign():
+    r = np.array([[[0, -1, 0], [-1, 0, 0], [0, 0, -1]]], dtype=float)
+    q = quaternions(r)[0]
+    expected = np.array([0.5 ** 0.5, -(0.5 ** 0.5), 0, 0])
+    assert np.allclose(q, expected) or np.allclose(q, -expected)
+
+
+def test_quaternions_identity():
+    assert np.allclose(quaternions(np.eye(3)[None]), [[0, 0, 0, 1]])
+
+
+def _doc(data):
+    (length,) = struct.unpack_from("<I", data, 12)
+    return json.loads(data[20 : 20 + length])
+
+
+def test_unpack_restores_indices():
+    positions = np.array([(0, 0, 0), (10, 0, 0), (0, 5, 0), (0, 0, 2)], np.float32)
+    indices = np.array([(0, 1, 2), (0, 3, 1), (3, 2, 1)], np.uint32)
+    g = GLB(packed=True)
+    g.add_mesh(positions, indices)
+    data = unpack(g.tobytes())
+    doc = _doc(data)
+    prim = doc["meshes"][0]["primitives"][0]
+    view = doc["bufferViews"][doc["accessors"][prim["indices"]]["bufferView"]]
+    start = 20 + struct.unpack_from("<I", data, 12)[0] + 8 + view["byteOffset"]
+    found = np.frombuffer(data, np.uint16, indices.size, start)
+    # the corners are split for their flat normals
+    expected = vertex_normals(positions, indices.reshape(-1))[1]
+    assert found.tolist() == expected.tolist()
+
+
+def cube():
+    " unit cube , 8 shared corners , counter clockwise outside "
+    positions = np.array(
+        [(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)], np.float32
+    )
+    quads = [
+        (0, 1, 3, 2),
+        (4, 6, 7, 5),
+        (0, 4, 5, 1),
+        (2, 3, 7, 6),
+        (0, 2, 6, 4),
+        (1, 5, 7, 3),
+    ]
+    tris = [(a, b, c) for a, b, c, d in quads] + [(a, c, d) for a, b, c, d in quads]
+    return positions, np.array(tris, np.uint32)
+
+
+def cylinder(n=64, r=5.0, h=3.0):
+    " just the side , shared vertices round the rim "
+    a = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    ring = np.column_stack([r * np.cos(a), r * np.sin(a)])
+    positions = np.concatenate(
+        [np.column_stack([ring, np.zeros(n)]), np.column_stack([ring, np.full(n, h)])]
+    ).astype(np.float32)
+    i = np.arange(n)
+    j = (i + 1) % n
+    tris = np.concatenate(
+        [np.column_stack([i, j, j + n]), np.column_stack([i, j + n, i + n])]
+    )
+    return positions, tris.astype(np.uint32)
+
+
+def corner_normals(positions, indices, normals):
+    " flat normal of each triangle against the normal at each corner "
+    tris = indices.reshape(-1, 3)
+    p = positions[tris]
+    face = np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0])
+    face /= np.linalg.norm(face, axis=1)[:, None]
+    return face, normals[tris]
+
+
+def test_cube_normals_are_flat():
+    positions, indices, normals = vertex_normals(*cube())
+    face, corner = corner_normals(positions, indices, normals)
+    assert np.allclose(corner, face[:, None, :], atol=1e-6)
+    # one vertex per corner and face , the shared ones dropped
+    assert len(positions) == 24
+    assert sorted(set(map(tuple, positions.tolist()))) == sorted(
+        map(tuple, cube()[0].tolist())
+    )
+
+
+def test_cylinder_normals_are_smooth():
+    before, tris = cylinder()
+    positions, indices, normals = vertex_normals(before, tris)
+    assert len(positions) == len(before)
+    assert np.array_equal(indices, tris)
+    radial = positions[:, :2] / np.linalg.norm(positions[:, :2], axis=1)[:, None]
+    assert np.allclose(normals[:, :2], radial, atol=1e-6)
+    assert np.allclose(normals[:, 2], 0, atol=1e-6)
+
+
+def _accessor(data, doc, i):
+    " an accessor's values , one row per element , padding kept "
+    acc = doc["accessors"][i]
+    view = doc["bufferViews"][acc["bufferView"]]
+    dtype = {5120: np.int8, 5122: np.int16, 5126: np.float32}[acc["componentType"]]
+    width = view.get("byteStride", np.dtype(dtype).itemsize * 3) // np.dtype(
+        dtype
+    ).itemsize
+    start = 20 + struct.unpack_from("<I", data, 12)[0] + 8 + view["byteOffset"]
+    values = np.frombuffer(data, dtype, acc["count"] * width, start)
+    return values.reshape(-1, width)[:, :3]
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_glb_normals(packed):
+    # squashed so the quantised box scales unevenly
+    positions, tris = cylinder(r=40.0, h=2.0)
+    g = GLB(packed=packed)
+    g.add_mesh(positions, tris)
+    data = g.tobytes()
+    if packed:
+        data = unpack(data)
+    doc = _doc(data)
+    prim = doc["meshes"][0]["primitives"][0]
+    acc = doc["accessors"][prim["attributes"]["NORMAL"]]
+    expected = vertex_normals(positions, tris)[2]
+    normals = _accessor(data, doc, prim["attributes"]["NORMAL"])
+    if packed:
+        assert acc["componentType"] == 5120 and acc["normalized"]
+        view = doc["bufferViews"][acc["bufferView"]]
+        assert view["byteStride"] == 4
+        # through the dequantise matrix , normals take its inverse transpose
+        m = np.array(g._unpack[0]).reshape(4, 4).T[:3, :3]
+        normals = normals / 127.0 @ np.linalg.inv(m)
+        normals /= np.linalg.norm(normals, axis=1)[:, None]
+        assert np.allclose(normals, expected, atol=0.02)
+    else:
+        assert acc["componentType"] == 5126
+        assert np.allclose(normals, expected)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("cqparts")
+pytest.importorskip("rectpack")
+
+from .outline import min_area_rect
+from .nesting import Placement
+
+
+def turn(pts, angle):
+    a = np.radians(angle)
+    rot = np.array([[np.cos(a), -np.sin(a)], [np.sin(a), np.cos(a)]])
+    return pts.dot(rot.T)
+
+
+def outline():
+    " a 40 x 10 slot turned 25 degrees , off the origin "
+    pts = np.array([(0, 0), (40, 0), (40, 10), (0, 10), (20, 0), (20, 10)])
+    return turn(pts, 25) + (7, -3)
+
+
+@pytest.mark.parametrize("rotated", [False, True])
+def test_offset_centres_the_part(rotated):
+    pts = outline()
+    r = min_area_rect(pts)
+    p = Placement("slot", None, r, 300.0, 150.0, rotated)
+    # what placed() does to the part , rotate about the origin then move
+    placed = turn(pts, p.angle) + p.offset()[:2]
+    lo, hi = placed.min(axis=0), placed.max(axis=0)
+    assert np.allclose((lo + hi) / 2, (300, 150))
+    size = (r.length, r.width) if rotated else (r.width, r.length)
+    assert np.allclose(hi - lo, size)
+
+
+def test_angle():
+    r = min_area_rect(outline())
+    assert Placement("a", None, r, 0, 0, False).angle == r.angle
+    assert Placement("a", None, r, 0, 0, True).angle == r.angle + 90
@@ -0,0 +1,54 @@
+import numpy as np
+
+from .outline import convex_hull, min_area_rect
+
+
+def box(width, length, angle, centre=(0, 0)):
+    " corners and edge midpoints of a rotated rectangle "
+    x, y = width / 2.0, length / 2.0
+    pts = np.array(
+        [(-x, -y), (0, -y), (x, -y), (x, 0), (x, y), (0, y), (-x, y), (-x, 0)]
+    )
+    a = np.radians(angle)
+    rot = np.array([[np.cos(a), -np.sin(a)], [np.sin(a), np.cos(a)]])
+    return pts.dot(rot.T) + centre
+
+
+def test_hull_square():
+    pts = np.array([(0, 0), (1, 0), (1, 1), (0, 1), (0.5, 0.5), (0.5, 0)])
+    hull = convex_hull(pts)
+    assert hull.tolist() == [[0, 0], [1, 0], [1, 1], [0, 1]]
+
+
+def test_hull_matches_random():
+    rng = np.random.RandomState(1)
+    pts = rng.normal(size=(2000, 2))
+    hull = convex_hull(pts)
+    # counter clockwise , every point is on the left of every edge
+    edges = np.roll(hull, -1, axis=0) - hull
+    for p, e in zip(hull, edges):
+        cross = e[0] * (pts[:, 1] - p[1]) - e[1] * (pts[:, 0] - p[0])
+        assert cross.min() > -1e-9
+
+
+def test_hull_collinear():
+    pts = np.array([(0, 0), (1, 1), (2, 2), (3, 3)])
+    assert convex_hull(pts).tolist() == [[0, 0], [3, 3]]
+
+
+def test_min_area_rect_rotated_box():
+    pts = box(40, 10, 30, centre=(5, -2))
+    r = min_area_rect(pts)
+    assert np.allclose(sorted([r.width, r.length]), [10, 40])
+    # turning the points by angle makes the rectangle axis aligned
+    a = np.radians(r.angle)
+    rot = np.array([[np.cos(a), -np.sin(a)], [np.sin(a), np.cos(a)]])
+    turned = pts.dot(rot.T)
+    lo, hi = turned.min(axis=0), turned.max(axis=0)
+    assert np.allclose(hi - lo, [r.width, r.length])
+    assert np.allclose((lo + hi) / 2, [r.cx, r.cy])
+
+
+def test_min_area_rect_axis_aligned():
+    r = min_area_rect(box(20, 30, 0))
+    assert np.allclose([r.width, r.length, r.angle], [20, 30, 0])
@@ -0,0 +1,127 @@
+import pytest
+
+cq = pytest.importorskip("cadquery")
+cqparts = pytest.importorskip("cqparts")
+
+from cqparts.params import PositiveFloat
+from cqparts.constraint import Fixed
+from cqparts.utils.geometry import CoordSystem
+
+from . import cache, parallel, progress
+
+
+class TwoBlocks(cqparts.Part):
+    " two disjoint blocks in one compound , like the fused box tabs "
+
+    def make(self):
+        a = cq.Solid.makeBox(1, 1, 1)
+        b = cq.Solid.makeBox(1, 1, 1, pnt=cq.Vector(5, 0, 0))
+        return cq.Workplane("XY").newObject([cq.Compound.makeCompound([a, b])])
+
+
+def solids(obj):
+    return len(cache.workplane_shape(obj).Solids)
+
+
+def test_compound_make_in_the_pool():
+    data = parallel._make((TwoBlocks, {}))
+    assert data is not None
+    assert len(parallel._from_brep(data).Solids) == 2
+
+
+def test_compound_part_cache(tmp_path):
+    part = TwoBlocks()
+    key = cache.part_key(part)
+    pc = cache.PartCache(str(tmp_path))
+    pc.put(key, part.local_obj)
+    assert pc.total > 0
+    assert solids(pc.get(key)) == 2
+
+
+def test_compound_interned():
+    with cache.interning() as interner:
+        a, b = TwoBlocks(), TwoBlocks()
+        assert solids(a.local_obj) == 2
+        assert solids(b.local_obj) == 2
+    assert interner.hits == 1
+
+
+# sizes made in this process , the pool workers fill their own copy
+MADE = []
+
+
+class Block(cqparts.Part):
+    size = PositiveFloat(10)
+
+    def make(self):
+        MADE.append(self.size)
+        return cq.Workplane("XY").box(self.size, self.size, self.size)
+
+
+def hole(part):
+    " a 2 x 2 square hole straight through "
+    part.local_obj = part.local_obj.cut(cq.Workplane("XY").box(2, 2, 100))
+
+
+class Inner(cqparts.Assembly):
+    def make_components(self):
+        return {"a": Block(size=10), "b": Block(size=12)}
+
+    def make_constraints(self):
+        return [
+            Fixed(self.components["a"]),
+            Fixed(self.components["b"], CoordSystem(origin=(30, 0, 0))),
+        ]
+
+    def make_alterations(self):
+        hole(self.components["a"])
+        hole(self.components["b"])
+
+
+class Outer(cqparts.Assembly):
+    def make_components(self):
+        return {"inner": Inner(), "c": Block(size=14)}
+
+    def make_constraints(self):
+        return [
+            Fixed(self.components["inner"]),
+            Fixed(self.components["c"], CoordSystem(origin=(0, 50, 0))),
+        ]
+
+    def make_alterations(self):
+        hole(self.components["c"])
+
+
+def volume(part):
+    return cache.workplane_shape(part.local_obj).Volume
+
+
+def test_nested_assembly_parts_go_through_the_pool():
+    del MADE[:]
+    made = []
+
+    def listener(ev):
+        if ev["event"] == "made":
+            made.append(ev["name"])
+
+    progress.listen(listener)
+    try:
+        asm = parallel.build(Outer(), processes=2)
+    finally:
+        progress.unlisten(listener)
+    # nothing made here , every block came back from the pool
+    assert MADE == []
+    assert made == ["Block"] * 3
+    # and the holes , the inner ones too , are in the pool made solids
+    assert volume(asm.find("inner.a")) == pytest.approx(1000 - 40)
+    assert volume(asm.find("inner.b")) == pytest.approx(1728 - 48)
+    assert volume(asm.find("c")) == pytest.approx(2744 - 56)
+
+
+def test_structure_pass_skips_every_alteration():
+    asm = Outer()
+    order = parallel.build_structure(asm)
+    assert [type(a).__name__ for a in order] == ["Inner", "Outer"]
+    inner = asm.components["inner"]
+    assert all(p._local_obj is None for p in inner.components.values())
+    assert len(parallel.leaf_parts(asm)) == 3
@@ -0,0 +1,22 @@
+import pytest
+
+from . import progress
+
+
+def test_stage_with_a_name():
+    with progress.recording() as rec:
+        with progress.stage("make", name="Wheel"):
+            pass
+    start, finish = rec.events
+    assert (start["event"], start["stage"], start["name"]) == ("start", "make", "Wheel")
+    assert (finish["event"], finish["stage"], finish["ok"]) == ("finish", "make", True)
+    assert list(rec.timings) == ["make"]
+
+
+def test_failed_stage_and_tags():
+    with progress.recording() as rec, progress.tagged(job="j1"):
+        with pytest.raises(ValueError):
+            with progress.stage("solve", name="Rover"):
+                raise ValueError("no")
+    assert [ev["job"] for ev in rec.events] == ["j1", "j1"]
+    assert rec.events[-1]["ok"] is False
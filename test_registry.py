@@ -0,0 +1,15 @@
+from . import _registry
+from .registry import SKIP, scan
+
+
+def test_registry_is_current():
+    " run python -m cqparts_bucket.registry if this fails "
+    classes, registered = scan()
+    assert classes == _registry.CLASSES
+    assert registered == _registry.REGISTERED
+
+
+def test_no_tests_or_scripts():
+    classes, registered = scan()
+    modules = set(classes.values()) | set(m for m, c, k in registered)
+    assert not [m for m in modules if m.startswith("test_") or m in SKIP]
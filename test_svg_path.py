@@ -0,0 +1,222 @@
+import math
+from collections import namedtuple
+
+from . import svg_path
+
+V = namedtuple("V", ["x", "y", "z"])
+
+
+class Bezier:
+    def __init__(self, poles):
+        self.poles = poles
+        self.Degree = len(poles) - 1
+
+    def getPoles(self):
+        return self.poles
+
+
+class BSplineCurve:
+    " stands in for the FreeCAD curve , one cubic piece "
+
+    def __init__(self, poles, weights):
+        self.poles = poles
+        self.weights = weights
+
+    def isRational(self):
+        return len(set(self.weights)) > 1
+
+    def copy(self):
+        return self
+
+    def segment(self, first, last):
+        pass
+
+    def toBezier(self):
+        return [Bezier(self.poles)]
+
+
+class Edge:
+    FirstParameter = 0.0
+    LastParameter = 1.0
+
+    def __init__(self, curve, points):
+        self.Curve = curve
+        self.points = points
+
+    def discretize(self, Deflection):
+        return self.points
+
+
+# a quarter circle , the exact conic is rational
+QUARTER = [V(math.cos(a), math.sin(a), 0) for a in (0, math.pi / 4, math.pi / 2)]
+POLES = [V(1, 0, 0), V(1, 1, 0), V(0, 1, 0)]
+
+
+def test_rational_spline_is_lines():
+    edge = Edge(BSplineCurve(POLES, [1, math.sqrt(0.5), 1]), QUARTER)
+    cmds = list(svg_path.edge_commands(edge))
+    assert [c for c, v in cmds] == ["L", "L"]
+    assert cmds[-1][1] == (QUARTER[-1].x, QUARTER[-1].y)
+
+
+def test_rational_spline_reversed():
+    edge = Edge(BSplineCurve(POLES, [1, math.sqrt(0.5), 1]), QUARTER)
+    cmds = list(svg_path.edge_commands(edge, reverse=True))
+    assert cmds[-1] == ("L", (1, 0))
+
+
+def test_plain_spline_is_bezier():
+    poles = [V(0, 0, 0), V(1, 2, 0), V(2, 2, 0), V(3, 0, 0)]
+    edge = Edge(BSplineCurve(poles, [1, 1, 1, 1]), [])
+    assert list(svg_path.edge_commands(edge)) == [("C", (1, 2, 2, 2, 3, 0))]
+    assert list(svg_path.edge_commands(edge, reverse=True)) == [
+        ("C", (2, 2, 1, 2, 0, 0))
+    ]
+
+
+class LineSegment:
+    pass
+
+
+class Circle:
+    def __init__(self, centre, radius, z=1):
+        self.Center = V(centre[0], centre[1], 0)
+        self.Radius = radius
+        self.Axis = V(0, 0, z)
+
+    def point(self, t):
+        # clockwise about -z
+        c, r, z = self.Center, self.Radius, self.Axis.z
+        return V(c.x + r * math.cos(t), c.y + z * r * math.sin(t), 0)
+
+
+class Ellipse(Circle):
+    def __init__(self, centre, major, minor, rotation):
+        Circle.__init__(self, centre, major)
+        self.MajorRadius = major
+        self.MinorRadius = minor
+        self.rotation = math.radians(rotation)
+
+    def point(self, t):
+        x, y = self.MajorRadius * math.cos(t), self.MinorRadius * math.sin(t)
+        c, s = math.cos(self.rotation), math.sin(self.rotation)
+        return V(self.Center.x + x * c - y * s, self.Center.y + x * s + y * c, 0)
+
+    def value(self, t):
+        return self.point(t)
+
+
+class CurveEdge:
+    def __init__(self, curve, first, last):
+        self.Curve = curve
+        self.FirstParameter = first
+        self.LastParameter = last
+
+    def valueAt(self, t):
+        return self.Curve.point(t)
+
+
+class Line(CurveEdge):
+    def __init__(self, a, b):
+        CurveEdge.__init__(self, LineSegment(), 0.0, 1.0)
+        self.a, self.b = V(a[0], a[1], 0), V(b[0], b[1], 0)
+
+    def valueAt(self, t):
+        return self.a if t == 0 else self.b
+
+
+class Wire:
+    def __init__(self, *edges):
+        self.OrderedEdges = list(edges)
+
+    def isSame(self, other):
+        return self is other
+
+
+class Face:
+    def __init__(self, outer, *holes):
+        self.OuterWire = outer
+        self.Wires = list(holes) + [outer]
+
+
+def close(a, b):
+    " points or lists of points "
+    if a and isinstance(a[0], tuple):
+        return len(a) == len(b) and all(close(p, q) for p, q in zip(a, b))
+    return all(abs(x - y) < 1e-9 for x, y in zip(a, b))
+
+
+def flags(cmd):
+    " rx , ry , rotation , large arc , sweep "
+    assert cmd[0] == "A"
+    return tuple(round(v, 9) for v in cmd[1][:5])
+
+
+def pens(cmds):
+    " where the pen is after each command "
+    return [v[-2:] for c, v in cmds if c != "Z"]
+
+
+def test_reversed_arc_chains():
+    # a box on the lower half of a circle , the arc runs (0, 0) to (10, 0)
+    # so the walk round the wire comes back along it the other way
+    arc = CurveEdge(Circle((5, 0), 5), math.pi, 2 * math.pi)
+    wire = Wire(
+        Line((0, 0), (0, 10)), Line((0, 10), (10, 10)), Line((10, 10), (10, 0)), arc
+    )
+    cmds = list(svg_path.wire_commands(wire))
+    assert [c for c, v in cmds] == ["M", "L", "L", "L", "A", "Z"]
+    assert close(pens(cmds), [(0, 0), (0, 10), (10, 10), (10, 0), (0, 0)])
+    # back along the arc is clockwise , so no sweep
+    assert flags(cmds[4]) == (5, 5, 0, 0, 0)
+
+
+def test_arc_forwards_and_large():
+    # three quarters , (5, 0) round to (0, -5) through (-5, 0)
+    arc = CurveEdge(Circle((0, 0), 5), 0, 1.5 * math.pi)
+    wire = Wire(arc, Line((0, -5), (5, -5)), Line((5, -5), (5, 0)))
+    cmds = list(svg_path.wire_commands(wire))
+    assert [c for c, v in cmds] == ["M", "A", "L", "L", "Z"]
+    assert close(pens(cmds), [(5, 0), (0, -5), (5, -5), (5, 0)])
+    assert flags(cmds[1]) == (5, 5, 0, 1, 1)
+
+
+def test_clockwise_axis():
+    # a quarter about -z , (5, 0) to (0, -5)
+    arc = CurveEdge(Circle((0, 0), 5, z=-1), 0, 0.5 * math.pi)
+    wire = Wire(arc, Line((0, -5), (0, 0)), Line((0, 0), (5, 0)))
+    cmds = list(svg_path.wire_commands(wire))
+    assert close(pens(cmds), [(5, 0), (0, -5), (0, 0), (5, 0)])
+    assert flags(cmds[1]) == (5, 5, 0, 0, 0)
+
+
+def test_full_circle_is_two_arcs():
+    circle = CurveEdge(Circle((20, 10), 3), 0, 2 * math.pi)
+    cmds = list(svg_path.wire_commands(Wire(circle)))
+    assert [c for c, v in cmds] == ["M", "A", "A", "Z"]
+    assert close(pens(cmds), [(23, 10), (17, 10), (23, 10)])
+    assert flags(cmds[1]) == flags(cmds[2]) == (3, 3, 0, 0, 1)
+
+
+def test_full_ellipse_keeps_its_rotation():
+    ellipse = CurveEdge(Ellipse((0, 0), 4, 2, 30), 0, 2 * math.pi)
+    cmds = list(svg_path.edge_commands(ellipse))
+    assert [flags(c) for c in cmds] == [(4, 2, 30, 0, 1)] * 2
+    start = Ellipse((0, 0), 4, 2, 30).point(0)
+    assert close(cmds[-1][1][-2:], (start.x, start.y))
+
+
+def test_face_outer_then_hole():
+    square = [(0, 0), (30, 0), (30, 20), (0, 20)]
+    # the edges of the outline run either way round
+    outer = Wire(
+        Line(square[0], square[1]),
+        Line(square[2], square[1]),
+        Line(square[2], square[3]),
+        Line(square[0], square[3]),
+    )
+    hole = Wire(CurveEdge(Circle((15, 10), 3), 0, 2 * math.pi))
+    cmds = list(svg_path.face_commands(Face(outer, hole)))
+    assert [c for c, v in cmds] == ["M", "L", "L", "L", "L", "Z", "M", "A", "A", "Z"]
+    assert close(pens(cmds[:6]), square + [(0, 0)])
+    assert close(pens(cmds[6:]), [(18, 10), (12, 10), (18, 10)])
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+from .svg_writer import SVGWriter, fmt
+
+
+@pytest.mark.parametrize(
+    "value, places, text",
+    [
+        (1.5, 3, "1.5"),
+        (2.0, 3, "2"),
+        (10, 3, "10"),
+        (100.0, 3, "100"),
+        (0.12345, 3, "0.123"),
+        (0.0005, 3, "0.001"),
+        (1.23456, 5, "1.23456"),
+        (1.25, 1, "1.2"),
+        (-0.0001, 3, "0"),
+        (-0.0, 3, "0"),
+        (-2.5, 3, "-2.5"),
+        (7.9999, 3, "8"),
+    ],
+)
+def test_fmt(value, places, text):
+    assert fmt(value, places) == text
+
+
+def test_path_uses_places():
+    f = io.StringIO()
+    svg = SVGWriter(f, 100, 50, places=2)
+    svg.path([("M", (0, 0)), ("L", (1.006, -0.001)), ("Z", ())], id="p1")
+    svg.close()
+    assert '<path d="M 0 0 L 1.01 0 Z" id="p1"/>' in f.getvalue()
+    assert 'width="100mm"' in f.getvalue()
+    assert svg.paths == 1
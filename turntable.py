@@ -167,17 +167,17 @@ class TurnTable(box.Boxen):
         const.append(Coincident(drive.mate_origin, top.mate_top()))
         return const
 
-    def make_alterations(self):
-        super(TurnTable, self).make_alterations()
+    def queue_alterations(self, q):
+        super(TurnTable, self).queue_alterations(q)
         back = self.components["back"]
         front = self.components["front"]
         left = self.components["left"]
         right = self.components["right"]
         mid = self.components["mid"]
-        back.cutter(mid)
-        front.cutter(mid)
-        left.cutter(mid)
-        right.cutter(mid)
+        back.cutter(mid, q)
+        front.cutter(mid, q)
+        left.cutter(mid, q)
+        right.cutter(mid, q)
 
 
 # positioned mount for target testing